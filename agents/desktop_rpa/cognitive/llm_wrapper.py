@@ -72,6 +72,50 @@ Create strategies that are:
 - Reusable (can be applied in similar situations)
 """
 
+# Response structures are static, so they live in the system prompts rather than
+# being rebuilt into every user message. This keeps the system message an identical
+# prefix across calls, which the provider can serve from its prompt cache.
+RESPONSE_FORMAT_ACTION = """
+**Please respond in JSON format with the following structure**:
+```json
+{
+  "suggestion": {
+    "action_type": "click|type|wait_for|screenshot",
+    "selector": "coordinates or element identifier",
+    "value": "value for the action (optional)",
+    "reasoning": "why this action",
+    "confidence": 0.0-1.0,
+    "metadata": {}
+  },
+  "state_assessment": "assessment of current state",
+  "next_state_prediction": "predicted next state",
+  "warnings": ["warning1", "warning2"]
+}
+```"""
+
+RESPONSE_FORMAT_STRATEGY = """
+**Please respond in JSON format with the following structure**:
+```json
+{
+  "strategy_name": "name of the strategy",
+  "goal": "goal of the strategy",
+  "preconditions": ["condition1", "condition2"],
+  "steps": [{"action_type": "...", "selector": "...", "value": "..."}],
+  "expected_states": ["state1", "state2"],
+  "confidence": 0.0-1.0,
+  "reasoning": "why this strategy"
+}
+```"""
+
+_SYSTEM_MESSAGE_ACTION = {
+    "role": "system",
+    "content": SYSTEM_PROMPT_ACTION + RESPONSE_FORMAT_ACTION,
+}
+_SYSTEM_MESSAGE_STRATEGY = {
+    "role": "system",
+    "content": SYSTEM_PROMPT_STRATEGY + RESPONSE_FORMAT_STRATEGY,
+}
+
 
 class LLMWrapper:
     """Wrapper for LLM interactions."""
@@ -134,9 +178,7 @@ class LLMWrapper:
         logger.info(f"Asking LLM for next action: goal={request.goal}, state={request.current_state}")
 
         # Build messages
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT_ACTION},
-        ]
+        messages = [_SYSTEM_MESSAGE_ACTION]
 
         # Build user message
         user_content = self._build_action_user_message(request)
@@ -192,9 +234,7 @@ class LLMWrapper:
         logger.info(f"Asking LLM for strategy: goal={request.goal}")
 
         # Build messages
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT_STRATEGY},
-        ]
+        messages = [_SYSTEM_MESSAGE_STRATEGY]
 
         # Build user message
         user_content = self._build_strategy_user_message(request)
@@ -256,25 +296,6 @@ class LLMWrapper:
         if request.context:
             text_parts.append(f"**Context**: {json.dumps(request.context, indent=2)}")
 
-        text_parts.append(
-            "\n**Please respond in JSON format with the following structure**:\n"
-            "```json\n"
-            "{\n"
-            '  "suggestion": {\n'
-            '    "action_type": "click|type|wait_for|screenshot",\n'
-            '    "selector": "coordinates or element identifier",\n'
-            '    "value": "value for the action (optional)",\n'
-            '    "reasoning": "why this action",\n'
-            '    "confidence": 0.0-1.0,\n'
-            '    "metadata": {}\n'
-            "  },\n"
-            '  "state_assessment": "assessment of current state",\n'
-            '  "next_state_prediction": "predicted next state",\n'
-            '  "warnings": ["warning1", "warning2"]\n'
-            "}\n"
-            "```"
-        )
-
         text_content = "\n\n".join(text_parts)
 
         # If screenshot is provided and vision is enabled, include it
@@ -306,21 +327,6 @@ class LLMWrapper:
         if request.context:
             parts.append(f"**Context**: {json.dumps(request.context, indent=2)}")
 
-        parts.append(
-            "\n**Please respond in JSON format with the following structure**:\n"
-            "```json\n"
-            "{\n"
-            '  "strategy_name": "name of the strategy",\n'
-            '  "goal": "goal of the strategy",\n'
-            '  "preconditions": ["condition1", "condition2"],\n'
-            '  "steps": [{"action_type": "...", "selector": "...", "value": "..."}],\n'
-            '  "expected_states": ["state1", "state2"],\n'
-            '  "confidence": 0.0-1.0,\n'
-            '  "reasoning": "why this strategy"\n'
-            "}\n"
-            "```"
-        )
-
         return "\n\n".join(parts)
 
     def _parse_action_response(self, data: dict[str, Any], raw_response: Any) -> LLMResponse:
@@ -215,6 +215,42 @@ class AgentClient:
         except httpx.HTTPError as e:
             logger.debug(f"Failed to send log: {e}")
     
+    async def send_logs(self, entries: list[dict[str, Any]]):
+        """Send several log entries to server in one request.
+        
+        Args:
+            entries: Log entries, oldest first, each with the keyword arguments
+                of send_log (level, message, and optionally task_goal and metadata)
+        """
+        if not self.credentials:
+            logger.warning("No credentials available, skipping log send")
+            return
+        
+        if not entries:
+            return
+        
+        log_entries = [
+            LogEntry(
+                agent_id=self.credentials.agent_id,
+                level=entry["level"],
+                message=entry["message"],
+                task_goal=entry.get("task_goal"),
+                metadata=entry.get("metadata") or {},
+            ).model_dump(mode="json")
+            for entry in entries
+        ]
+        
+        try:
+            response = await self.client.post(
+                f"{self.server_url}/api/v1/logs/batch",
+                json=log_entries,
+                headers={"Authorization": f"Bearer {self.credentials.api_key}"},
+            )
+            response.raise_for_status()
+            
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to send logs: {e}")
+    
     async def upload_screenshot(
         self,
         screenshot_path: Path,
@@ -3,38 +3,21 @@
 REST API for calculator operations.
 """
 
-import sys
-from pathlib import Path
 from typing import Annotated
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
-# Add parent directory to path to support both local and Docker execution
-parent_dir = Path(__file__).parent.parent
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
-
-# Try importing with scheduler prefix (local), fall back to direct import (Docker)
-try:
-    from scheduler.core.task_graph import TaskGraph
-    from scheduler.job_queue.job_queue import Job, JobQueue
-except ImportError:
-    from core.task_graph import TaskGraph
-    from job_queue.job_queue import Job, JobQueue
+from scheduler.api.deps import get_job_queue
+from scheduler.core.task_graph import TaskGraph
+from scheduler.job_queue.job_queue import Job, JobQueue
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/calculate", tags=["Calculator"])
 
 
-# This will be set by main.py
-def get_job_queue() -> JobQueue:
-    """Get JobQueue instance (to be overridden by main.py)."""
-    raise NotImplementedError("get_job_queue dependency not configured")
-
-
 class CalculateRequest(BaseModel):
     """Calculator request model."""
 
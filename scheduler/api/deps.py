@@ -0,0 +1,29 @@
+"""Shared API dependencies.
+
+Dependencies used by several routers, resolved from application state.
+"""
+
+from fastapi import HTTPException, Request, status
+
+from scheduler.job_queue.job_queue import JobQueue
+
+
+def get_job_queue(request: Request) -> JobQueue:
+    """Get the JobQueue bound to the application by the lifespan handler.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        JobQueue instance
+
+    Raises:
+        HTTPException: If JobQueue is not initialized
+    """
+    job_queue: JobQueue | None = getattr(request.app.state, "job_queue", None)
+    if job_queue is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job queue not initialized",
+        )
+    return job_queue
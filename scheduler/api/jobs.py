@@ -3,38 +3,21 @@
 REST API for job management (create, list, get, cancel, retry).
 """
 
-import sys
-from pathlib import Path
 from typing import Annotated
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
-# Add parent directory to path to support both local and Docker execution
-parent_dir = Path(__file__).parent.parent
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
-
-# Try importing with scheduler prefix (local), fall back to direct import (Docker)
-try:
-    from scheduler.core.task_graph import ActionType, TaskGraph, ToDo
-    from scheduler.job_queue.job_queue import Job, JobQueue, JobStatus
-except ImportError:
-    from core.task_graph import ActionType, TaskGraph, ToDo
-    from job_queue.job_queue import Job, JobQueue, JobStatus
+from scheduler.api.deps import get_job_queue
+from scheduler.core.task_graph import ActionType, TaskGraph, ToDo
+from scheduler.job_queue.job_queue import Job, JobQueue, JobStatus
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
-# This will be set by main.py
-def get_job_queue() -> JobQueue:
-    """Get JobQueue instance (to be overridden by main.py)."""
-    raise NotImplementedError("get_job_queue dependency not configured")
-
-
 class TaskRequest(BaseModel):
     """Task request model for API."""
 
@@ -211,8 +194,7 @@ async def list_jobs(
         List of jobs
     """
     try:
-        # Get all job IDs from Redis
-        # For now, we'll use a simple pattern match
+        # For now, we scan all stored jobs
         # In production, you'd want to use a sorted set or index
         if not job_queue.redis:
             raise HTTPException(
@@ -220,15 +202,7 @@ async def list_jobs(
                 detail="Redis not connected",
             )
 
-        # Get all job keys
-        job_keys = await job_queue.redis.keys("job:*")
-        jobs: list[Job] = []
-
-        for key in job_keys:
-            job_data = await job_queue.redis.get(key)
-            if job_data:
-                job_dict = Job.model_validate_json(job_data)
-                jobs.append(job_dict)
+        jobs = await job_queue.list_jobs()
 
         # Filter by status if provided
         if status_filter:
@@ -314,27 +288,24 @@ async def cancel_job(
         HTTPException: If job not found or already completed
     """
     try:
-        # Get job first to check status
-        job = await job_queue.get_job(job_id)
+        # Cancel job; the queue checks the current status in the same step
+        previous_status = await job_queue.cancel(job_id)
 
-        if not job:
+        if previous_status is None:
             logger.warning("job_not_found", job_id=job_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Job {job_id} not found",
             )
 
-        # Check if job can be cancelled
-        if job.status in [JobStatus.DONE, JobStatus.CANCELLED]:
-            logger.warning("job_already_completed", job_id=job_id, status=job.status)
+        # Check if job could be cancelled
+        if previous_status in [JobStatus.DONE, JobStatus.CANCELLED]:
+            logger.warning("job_already_completed", job_id=job_id, status=previous_status)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Job {job_id} is already {job.status.value}",
+                detail=f"Job {job_id} is already {previous_status.value}",
             )
 
-        # Cancel job
-        await job_queue.cancel(job_id)
-
         logger.info("job_cancelled", job_id=job_id)
 
     except HTTPException:
@@ -393,17 +364,14 @@ async def retry_job(
                 detail=f"Job {job_id} has exceeded maximum retries",
             )
 
-        # Get updated job
-        updated_job = await job_queue.get_job(job_id)
-        if not updated_job:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to retrieve updated job",
-            )
+        # Mirror the retry update locally instead of reading the job back
+        job.retry_count += 1
+        job.status = JobStatus.PENDING
+        job.error = None
 
-        logger.info("job_retried", job_id=job_id, retry_count=updated_job.retry_count)
+        logger.info("job_retried", job_id=job_id, retry_count=job.retry_count)
 
-        return _job_to_response(updated_job)
+        return _job_to_response(job)
 
     except HTTPException:
         raise
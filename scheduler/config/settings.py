@@ -78,6 +78,11 @@ class Settings(BaseSettings):
         """Get CORS methods as list."""
         return [method.strip() for method in self.cors_allow_methods.split(",")]
 
+    @property
+    def cors_allow_headers_list(self) -> list[str]:
+        """Get CORS allowed headers as list."""
+        return [header.strip() for header in self.cors_allow_headers.split(",") if header.strip()]
+
 
 # Global settings instance
 settings = Settings()
@@ -30,6 +30,8 @@ class AgentRegistry:
         """
         self.agents: list[Agent] = []
         self.config_path = config_path
+        # Capability -> agents, kept in sync with self.agents on every change
+        self._capability_index: dict[str, list[Agent]] = {}
 
         if config_path:
             self.load_agents(config_path)
@@ -55,12 +57,21 @@ class AgentRegistry:
                 return
 
             self.agents = [Agent(**agent_data) for agent_data in config["agents"]]
+            self._rebuild_index()
             logger.info(f"Loaded {len(self.agents)} agents from {config_path}")
 
         except Exception as e:
             logger.error(f"Failed to load agents from {config_path}: {e}", exc_info=True)
             raise
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the capability index from the current agent list."""
+        index: dict[str, list[Agent]] = {}
+        for agent in self.agents:
+            for capability in agent.capabilities:
+                index.setdefault(capability, []).append(agent)
+        self._capability_index = index
+
     def get_agent_by_name(self, name: str) -> Agent | None:
         """Get agent by name.
 
@@ -84,10 +95,8 @@ class AgentRegistry:
         Returns:
             Agent if found, None otherwise
         """
-        for agent in self.agents:
-            if capability in agent.capabilities:
-                return agent
-        return None
+        agents = self._capability_index.get(capability)
+        return agents[0] if agents else None
 
     def get_agents_by_capability(self, capability: str) -> list[Agent]:
         """Get all agents with specified capability.
@@ -98,7 +107,7 @@ class AgentRegistry:
         Returns:
             List of agents with the capability
         """
-        return [agent for agent in self.agents if capability in agent.capabilities]
+        return list(self._capability_index.get(capability, ()))
 
     def register_agent(self, agent: Agent) -> None:
         """Register a new agent.
@@ -109,6 +118,7 @@ class AgentRegistry:
         # Remove existing agent with same name
         self.agents = [a for a in self.agents if a.name != agent.name]
         self.agents.append(agent)
+        self._rebuild_index()
         logger.info(f"Registered agent: {agent.name}")
 
     def unregister_agent(self, name: str) -> bool:
@@ -124,6 +134,7 @@ class AgentRegistry:
         self.agents = [a for a in self.agents if a.name != name]
 
         if len(self.agents) < original_count:
+            self._rebuild_index()
             logger.info(f"Unregistered agent: {name}")
             return True
 
@@ -3,12 +3,12 @@
 A standardized protocol for structured communication between AI agents.
 """
 
-import json
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -83,7 +83,7 @@ class BaseMessage(BaseModel):
 
     def to_json(self) -> str:
         """Serialize message to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        return orjson.dumps(self.to_dict(), default=str).decode()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "BaseMessage":
@@ -93,7 +93,7 @@ class BaseMessage(BaseModel):
     @classmethod
     def from_json(cls, json_str: str) -> "BaseMessage":
         """Deserialize message from JSON string."""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
 
     class Config:
@@ -256,6 +256,6 @@ class MessageFactory:
         Raises:
             ValueError: If message type is unknown or missing
         """
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return MessageFactory.from_dict(data)
 
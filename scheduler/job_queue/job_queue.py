@@ -1,29 +1,23 @@
 """Job Queue implementation using Redis.
 
 Manages job queuing, status tracking, and retry logic.
+
+Each job is stored as a Redis hash with one JSON-encoded value per Job field, so
+status and result updates can rewrite individual fields instead of the whole job.
 """
 
-import json
-import sys
+import zlib
 from datetime import UTC, datetime
 from enum import Enum
-from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
-from redis.asyncio import Redis
-
-# Add scheduler directory to path to support both local and Docker execution
-scheduler_dir = Path(__file__).parent.parent
-if str(scheduler_dir) not in sys.path:
-    sys.path.insert(0, str(scheduler_dir))
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.commands.core import AsyncScript
 
-# Try importing with scheduler prefix (local), fall back to direct import (Docker)
-try:
-    from scheduler.core.task_graph import TaskGraph
-except ImportError:
-    from core.task_graph import TaskGraph
+from scheduler.core.task_graph import ActionType, TaskGraph, ToDo
 
 
 class JobStatus(str, Enum):
@@ -36,6 +30,29 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+def _task_graph_to_dict(task_graph: TaskGraph) -> dict[str, Any]:
+    """Convert a TaskGraph to plain JSON-compatible data.
+
+    Args:
+        task_graph: Task graph to convert
+
+    Returns:
+        Dictionary representation
+    """
+    return {
+        "tasks": {
+            task_id: {
+                "action": task.action.value,
+                "selector": task.selector,
+                "text": task.text,
+                "timeout": task.timeout,
+                "depends_on": task.depends_on,
+            }
+            for task_id, task in task_graph.tasks.items()
+        }
+    }
+
+
 class Job(BaseModel):
     """Job model.
 
@@ -64,18 +81,7 @@ class Job(BaseModel):
         """
         data = super().model_dump(**kwargs)
         # Serialize TaskGraph manually
-        data["task_graph"] = {
-            "tasks": {
-                task_id: {
-                    "action": task.action.value,
-                    "selector": task.selector,
-                    "text": task.text,
-                    "timeout": task.timeout,
-                    "depends_on": task.depends_on,
-                }
-                for task_id, task in self.task_graph.tasks.items()
-            }
-        }
+        data["task_graph"] = _task_graph_to_dict(self.task_graph)
         # Serialize datetime objects
         if data.get("created_at"):
             data["created_at"] = data["created_at"].isoformat()
@@ -86,43 +92,182 @@ class Job(BaseModel):
         return data
 
 
+# Job fields stored as-is in the job hash (task_graph is converted separately)
+_JOB_VALUE_FIELDS = tuple(name for name in Job.model_fields if name != "task_graph")
+_JOB_DATETIME_FIELDS = ("created_at", "started_at", "completed_at")
+_FAILED_JOB_FIELDS = ("status", "error", "completed_at")
+
+# Encoded task graphs larger than this are zlib-compressed before being stored.
+# A zlib stream starts with 0x78 and a JSON object with "{", so both forms can be
+# told apart on read and uncompressed values written earlier still load.
+_TASK_GRAPH_COMPRESS_THRESHOLD = 4096
+_TASK_GRAPH_COMPRESS_LEVEL = 1
+_ZLIB_HEADER = 0x78
+
+# Stored enum value -> member; a dict lookup is much cheaper than calling the enum
+_ACTION_TYPES = {action.value: action for action in ActionType}
+_JOB_STATUSES = {status.value: status for status in JobStatus}
+
+# Update job hash fields in place if the job exists. ARGV[1] is the number of
+# field/value pairs that are always written; the pairs after them are only
+# written where the stored value is still null.
+_UPDATE_JOB_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local n = tonumber(ARGV[1])
+for i = 2, 2 * n, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+for i = 2 * n + 2, #ARGV, 2 do
+    local current = redis.call('HGET', KEYS[1], ARGV[i])
+    if not current or current == 'null' then
+        redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+# Cancel a job unless its status is one of ARGV[3..]. Returns the status the job
+# had before (encoded), or nil if it does not exist.
+# ARGV: encoded cancelled status, encoded completion time, blocking statuses.
+_CANCEL_JOB_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'status')
+if not current then
+    return nil
+end
+for i = 3, #ARGV do
+    if current == ARGV[i] then
+        return current
+    end
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1], 'completed_at', ARGV[2])
+return current
+"""
+
+# Reset a job to pending and re-enqueue it unless it is out of retries.
+# KEYS: job hash, queue list. ARGV: encoded pending status, job ID.
+_RETRY_JOB_SCRIPT = """
+local counts = redis.call('HMGET', KEYS[1], 'retry_count', 'max_retries')
+if not counts[1] then
+    return 0
+end
+local retry_count = tonumber(counts[1])
+if retry_count >= tonumber(counts[2]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'retry_count', retry_count + 1, 'status', ARGV[1], 'error', 'null')
+redis.call('RPUSH', KEYS[2], ARGV[2])
+return 1
+"""
+
+
+def _flatten(fields: dict[str, bytes]) -> list[str | bytes]:
+    """Flatten a field mapping into alternating field/value script arguments.
+
+    Args:
+        fields: Field name to encoded value
+
+    Returns:
+        Flat argument list
+    """
+    return [item for pair in fields.items() for item in pair]
+
+
+def _encode_task_graph(task_graph: TaskGraph) -> bytes:
+    """Encode a task graph for the job hash, compressing large graphs.
+
+    Args:
+        task_graph: Task graph to encode
+
+    Returns:
+        JSON bytes, zlib-compressed above the size threshold
+    """
+    encoded = orjson.dumps(_task_graph_to_dict(task_graph))
+    if len(encoded) > _TASK_GRAPH_COMPRESS_THRESHOLD:
+        return zlib.compress(encoded, _TASK_GRAPH_COMPRESS_LEVEL)
+    return encoded
+
+
+def _decode_task_graph(value: bytes) -> dict[str, Any]:
+    """Decode a task graph value written by _encode_task_graph.
+
+    Args:
+        value: Stored task graph value
+
+    Returns:
+        Task graph as a dict
+    """
+    if value[0] == _ZLIB_HEADER:
+        value = zlib.decompress(value)
+    return orjson.loads(value)
+
+
 class JobQueue:
     """Job queue using Redis.
 
     Manages job queuing, dequeuing, status tracking, and retry logic.
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379") -> None:
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        max_connections: int = 10,
+        health_check_interval: int = 30,
+    ) -> None:
         """Initialize job queue.
 
         Args:
             redis_url: Redis connection URL
+            max_connections: Size of the Redis connection pool. Callers beyond this
+                wait for a free connection instead of opening new ones.
+            health_check_interval: Seconds a pooled connection may sit idle before
+                it is pinged on checkout
         """
         self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
         self.redis: Redis | None = None
+        self._update_job: AsyncScript | None = None
+        self._retry_job: AsyncScript | None = None
+        self._cancel_job: AsyncScript | None = None
         self.queue_key = "cpa:jobs:queue"
         self.job_key_prefix = "cpa:jobs:data:"
+        # Keys are built as bytes so redis-py sends them without re-encoding
+        self._job_key_prefix_b = self.job_key_prefix.encode()
 
     async def connect(self) -> None:
         """Connect to Redis."""
-        self.redis = Redis.from_url(self.redis_url, decode_responses=False)
+        pool = BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            health_check_interval=self.health_check_interval,
+            decode_responses=False,
+        )
+        # The client owns the pool and disconnects it on close
+        self.redis = Redis.from_pool(pool)
         await self.redis.ping()
+        self._update_job = self.redis.register_script(_UPDATE_JOB_SCRIPT)
+        self._retry_job = self.redis.register_script(_RETRY_JOB_SCRIPT)
+        self._cancel_job = self.redis.register_script(_CANCEL_JOB_SCRIPT)
 
     async def close(self) -> None:
         """Close Redis connection."""
         if self.redis:
             await self.redis.close()
 
-    def _get_job_key(self, job_id: str) -> str:
+    def _get_job_key(self, job_id: str | bytes) -> bytes:
         """Get Redis key for job data.
 
         Args:
-            job_id: Job ID
+            job_id: Job ID, as str or as raw bytes read back from the queue
 
         Returns:
             Redis key
         """
-        return f"{self.job_key_prefix}{job_id}"
+        if isinstance(job_id, str):
+            job_id = job_id.encode()
+        return self._job_key_prefix_b + job_id
 
     async def enqueue(self, job: Job) -> str:
         """Enqueue a job.
@@ -140,16 +285,42 @@ class JobQueue:
             msg = "Not connected to Redis"
             raise RuntimeError(msg)
 
-        # Store job data
-        job_key = self._get_job_key(job.id)
-        job_data = json.dumps(job.model_dump())
-        await self.redis.set(job_key, job_data)
-
-        # Add job ID to queue
-        await self.redis.rpush(self.queue_key, job.id)  # type: ignore[misc]
+        # Store job data and add job ID to queue in one round-trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(self._get_job_key(job.id), mapping=self._serialize_job(job))
+            pipe.rpush(self.queue_key, job.id)
+            await pipe.execute()
 
         return job.id
 
+    async def enqueue_many(self, jobs: list[Job]) -> list[str]:
+        """Enqueue several jobs in a single round-trip.
+
+        Args:
+            jobs: Jobs to enqueue, in queue order
+
+        Returns:
+            Job IDs
+
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
+
+        if not jobs:
+            return []
+
+        job_ids = [job.id for job in jobs]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job in jobs:
+                pipe.hset(self._get_job_key(job.id), mapping=self._serialize_job(job))
+            pipe.rpush(self.queue_key, *job_ids)
+            await pipe.execute()
+
+        return job_ids
+
     async def dequeue(self) -> Job | None:
         """Dequeue a job.
 
@@ -163,47 +334,127 @@ class JobQueue:
             msg = "Not connected to Redis"
             raise RuntimeError(msg)
 
-        # Pop job ID from queue
-        job_id_bytes = await self.redis.lpop(self.queue_key)  # type: ignore[misc]
-        if not job_id_bytes:
+        # Pop job ID from queue; the client returns raw bytes, which key the hash as-is
+        job_id = await self.redis.lpop(self.queue_key)  # type: ignore[misc]
+        if not job_id:
             return None
 
-        job_id = job_id_bytes.decode() if isinstance(job_id_bytes, bytes) else job_id_bytes
+        fields = await self.redis.hgetall(self._get_job_key(job_id))  # type: ignore[misc]
+        if not fields:
+            return None
 
-        # Get job data
-        job_key = self._get_job_key(job_id)
-        job_data_bytes = await self.redis.get(job_key)
+        return self._deserialize_job(fields)
+
+    async def dequeue_blocking(self, timeout: float = 5) -> Job | None:
+        """Dequeue a job, waiting for one to arrive if the queue is empty.
+
+        Uses BLPOP, so an idle caller is woken by Redis as soon as a job is
+        enqueued instead of polling.
+
+        Args:
+            timeout: Seconds to wait for a job (0 waits forever)
+
+        Returns:
+            Job or None if no job arrived within the timeout
 
-        if not job_data_bytes:
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
+
+        popped = await self.redis.blpop([self.queue_key], timeout=timeout)  # type: ignore[misc]
+        if not popped:
             return None
 
-        job_data = job_data_bytes.decode() if isinstance(job_data_bytes, bytes) else job_data_bytes
+        _, job_id = popped
+        fields = await self.redis.hgetall(self._get_job_key(job_id))  # type: ignore[misc]
+        if not fields:
+            return None
 
-        # Deserialize job
-        job_dict = json.loads(job_data)
+        return self._deserialize_job(fields)
 
-        # Reconstruct TaskGraph
-        task_graph_data = job_dict.pop("task_graph")
-        task_graph = TaskGraph()
-        task_graph.tasks = {
-            task_id: self._deserialize_todo(task_data)
-            for task_id, task_data in task_graph_data.get("tasks", {}).items()
+    async def dequeue_batch(self, count: int = 32) -> list[Job]:
+        """Dequeue up to count jobs in two round-trips.
+
+        Pops the IDs with a single LPOP ... COUNT (Redis >= 6.2), then reads all job
+        hashes in one pipeline. Jobs whose data no longer exists are skipped.
+
+        Args:
+            count: Maximum number of jobs to dequeue
+
+        Returns:
+            Dequeued jobs in queue order (empty if the queue is empty)
+
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
+
+        job_ids = await self.redis.lpop(self.queue_key, count)  # type: ignore[misc]
+        if not job_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(self._get_job_key(job_id))
+            results = await pipe.execute()
+
+        return [self._deserialize_job(fields) for fields in results if fields]
+
+    def _serialize_job(self, job: Job) -> dict[str, bytes]:
+        """Serialize Job into Redis hash fields.
+
+        Args:
+            job: Job to serialize
+
+        Returns:
+            Mapping of field name to JSON-encoded value
+        """
+        # orjson encodes datetimes and enums itself, so fields are read straight off
+        # the model instead of going through a full model_dump()
+        fields = {name: orjson.dumps(getattr(job, name)) for name in _JOB_VALUE_FIELDS}
+        fields["task_graph"] = _encode_task_graph(job.task_graph)
+        return fields
+
+    def _deserialize_job(self, fields: dict[bytes, bytes]) -> Job:
+        """Deserialize Job from Redis hash fields.
+
+        Args:
+            fields: Raw hash fields as returned by HGETALL
+
+        Returns:
+            Job instance
+        """
+        job_dict = {
+            key.decode(): orjson.loads(value)
+            for key, value in fields.items()
+            if key != b"task_graph"
         }
 
-        # Parse datetime fields
-        if job_dict.get("created_at"):
-            job_dict["created_at"] = datetime.fromisoformat(job_dict["created_at"])
-        if job_dict.get("started_at"):
-            job_dict["started_at"] = datetime.fromisoformat(job_dict["started_at"])
-        if job_dict.get("completed_at"):
-            job_dict["completed_at"] = datetime.fromisoformat(job_dict["completed_at"])
+        # Reconstruct TaskGraph
+        task_graph_data = _decode_task_graph(fields[b"task_graph"])
+        task_graph = TaskGraph.model_construct(
+            tasks={
+                task_id: self._deserialize_todo(task_data)
+                for task_id, task_data in task_graph_data.get("tasks", {}).items()
+            }
+        )
 
-        # Create Job instance
-        job = Job(task_graph=task_graph, **job_dict)
+        # Parse enum and datetime fields
+        job_dict["status"] = _JOB_STATUSES[job_dict["status"]]
+        for name in _JOB_DATETIME_FIELDS:
+            if job_dict.get(name):
+                job_dict[name] = datetime.fromisoformat(job_dict[name])
 
-        return job
+        # Create Job instance; the data was written by _serialize_job, so it is
+        # trusted and not validated again
+        return Job.model_construct(task_graph=task_graph, **job_dict)
 
-    def _deserialize_todo(self, task_data: dict[str, Any]) -> Any:
+    def _deserialize_todo(self, task_data: dict[str, Any]) -> ToDo:
         """Deserialize ToDo from dict.
 
         Args:
@@ -212,10 +463,8 @@ class JobQueue:
         Returns:
             ToDo instance
         """
-        from scheduler.core.task_graph import ActionType, ToDo
-
-        return ToDo(
-            action=ActionType(task_data["action"]),
+        return ToDo.model_construct(
+            action=_ACTION_TYPES[task_data["action"]],
             selector=task_data["selector"],
             text=task_data.get("text"),
             timeout=task_data.get("timeout", 30.0),
@@ -238,8 +487,9 @@ class JobQueue:
             msg = "Not connected to Redis"
             raise RuntimeError(msg)
 
-        job = await self.get_job(job_id)
-        return job.status if job else None
+        # Read only the status field instead of decoding the whole job
+        raw = await self.redis.hget(self._get_job_key(job_id), "status")  # type: ignore[misc]
+        return _JOB_STATUSES[orjson.loads(raw)] if raw else None
 
     async def update_status(
         self,
@@ -263,34 +513,69 @@ class JobQueue:
             msg = "Not connected to Redis"
             raise RuntimeError(msg)
 
-        job = await self.get_job(job_id)
-        if not job:
-            return
-
-        job.status = status
+        # Only the changed fields are written, in one script call; the job is not
+        # read back. Missing jobs are left alone.
+        now = orjson.dumps(datetime.now(UTC))
+        fields: dict[str, bytes] = {"status": orjson.dumps(status)}
         if error:
-            job.error = error
+            fields["error"] = orjson.dumps(error)
         if result:
-            job.result = result
-
-        if status == JobStatus.RUNNING and not job.started_at:
-            job.started_at = datetime.now(UTC)
+            fields["result"] = orjson.dumps(result)
+        unset_fields: dict[str, bytes] = {}
+        if status == JobStatus.RUNNING:
+            unset_fields["started_at"] = now
         elif status in (JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED):
-            job.completed_at = datetime.now(UTC)
+            fields["completed_at"] = now
 
-        # Save updated job
-        job_key = self._get_job_key(job_id)
-        job_data = json.dumps(job.model_dump())
-        await self.redis.set(job_key, job_data)
+        await self._update_job(
+            keys=[self._get_job_key(job_id)],
+            args=[len(fields), *_flatten(fields), *_flatten(unset_fields)],
+        )
 
-    async def retry(self, job_id: str) -> bool:
-        """Retry a failed job.
+    async def mark_failed(self, job: Job, error: str) -> None:
+        """Fail a job the caller holds.
+
+        Updates the caller's copy and writes the status, error and completion time
+        in a single script call, so the stored job and the copy stay in sync.
 
         Args:
-            job_id: Job ID
+            job: Job to fail
+            error: Error message
 
-        Returns:
-            True if job was retried, False if max retries exceeded
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
+
+        job.status = JobStatus.FAILED
+        job.error = error
+        job.completed_at = datetime.now(UTC)
+        fields = {name: orjson.dumps(getattr(job, name)) for name in _FAILED_JOB_FIELDS}
+
+        await self._update_job(
+            keys=[self._get_job_key(job.id)],
+            args=[len(fields), *_flatten(fields)],
+        )
+
+    async def set_result(
+        self,
+        job_id: str,
+        result: dict[str, Any],
+        status: JobStatus = JobStatus.DONE,
+    ) -> None:
+        """Store a job's result and terminal status.
+
+        Only the result, status and completion timestamp fields are written, in
+        one script call; the task graph and other fields are left untouched.
+        Missing jobs are left alone, so a job deleted while it ran is not
+        recreated as a partial hash.
+
+        Args:
+            job_id: Job ID
+            result: Job result data
+            status: Final status (defaults to DONE)
 
         Raises:
             RuntimeError: If not connected to Redis
@@ -299,39 +584,68 @@ class JobQueue:
             msg = "Not connected to Redis"
             raise RuntimeError(msg)
 
-        job = await self.get_job(job_id)
-        if not job:
-            return False
+        fields = {
+            "status": orjson.dumps(status),
+            "result": orjson.dumps(result),
+            "completed_at": orjson.dumps(datetime.now(UTC)),
+        }
+        await self._update_job(
+            keys=[self._get_job_key(job_id)],
+            args=[len(fields), *_flatten(fields)],
+        )
 
-        # Check if max retries exceeded
-        if job.retry_count >= job.max_retries:
-            return False
+    async def retry(self, job_id: str) -> bool:
+        """Retry a failed job.
 
-        # Increment retry count
-        job.retry_count += 1
-        job.status = JobStatus.PENDING
-        job.error = None
+        Args:
+            job_id: Job ID
 
-        # Save updated job
-        job_key = self._get_job_key(job_id)
-        job_data = json.dumps(job.model_dump())
-        await self.redis.set(job_key, job_data)
+        Returns:
+            True if job was retried, False if max retries exceeded
 
-        # Re-enqueue job
-        await self.redis.rpush(self.queue_key, job_id)  # type: ignore[misc]
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
 
-        return True
+        # Retry limit check, counter bump and re-enqueue run atomically in Redis
+        retried = await self._retry_job(
+            keys=[self._get_job_key(job_id), self.queue_key],
+            args=[orjson.dumps(JobStatus.PENDING), job_id],
+        )
+        return bool(retried)
 
-    async def cancel(self, job_id: str) -> None:
+    async def cancel(self, job_id: str) -> JobStatus | None:
         """Cancel a job.
 
+        The status check and the update run atomically in one round-trip. Jobs
+        that are already DONE or CANCELLED are left unchanged.
+
         Args:
             job_id: Job ID
 
+        Returns:
+            Job status before the call, or None if the job does not exist
+
         Raises:
             RuntimeError: If not connected to Redis
         """
-        await self.update_status(job_id, JobStatus.CANCELLED)
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
+
+        previous = await self._cancel_job(
+            keys=[self._get_job_key(job_id)],
+            args=[
+                orjson.dumps(JobStatus.CANCELLED),
+                orjson.dumps(datetime.now(UTC)),
+                orjson.dumps(JobStatus.DONE),
+                orjson.dumps(JobStatus.CANCELLED),
+            ],
+        )
+        return _JOB_STATUSES[orjson.loads(previous)] if previous else None
 
     async def get_job(self, job_id: str) -> Job | None:
         """Get a job by ID.
@@ -350,34 +664,34 @@ class JobQueue:
             raise RuntimeError(msg)
 
         job_key = self._get_job_key(job_id)
-        job_data_bytes = await self.redis.get(job_key)
+        fields = await self.redis.hgetall(job_key)  # type: ignore[misc]
 
-        if not job_data_bytes:
+        if not fields:
             return None
 
-        job_data = job_data_bytes.decode() if isinstance(job_data_bytes, bytes) else job_data_bytes
+        return self._deserialize_job(fields)
 
-        # Deserialize job
-        job_dict = json.loads(job_data)
+    async def list_jobs(self) -> list[Job]:
+        """List all stored jobs.
 
-        # Reconstruct TaskGraph
-        task_graph_data = job_dict.pop("task_graph")
-        task_graph = TaskGraph()
-        task_graph.tasks = {
-            task_id: self._deserialize_todo(task_data)
-            for task_id, task_data in task_graph_data.get("tasks", {}).items()
-        }
+        Returns:
+            List of jobs (unordered)
+
+        Raises:
+            RuntimeError: If not connected to Redis
+        """
+        if not self.redis:
+            msg = "Not connected to Redis"
+            raise RuntimeError(msg)
 
-        # Parse datetime fields
-        if job_dict.get("created_at"):
-            job_dict["created_at"] = datetime.fromisoformat(job_dict["created_at"])
-        if job_dict.get("started_at"):
-            job_dict["started_at"] = datetime.fromisoformat(job_dict["started_at"])
-        if job_dict.get("completed_at"):
-            job_dict["completed_at"] = datetime.fromisoformat(job_dict["completed_at"])
+        job_keys = [key async for key in self.redis.scan_iter(match=f"{self.job_key_prefix}*")]
+        if not job_keys:
+            return []
 
-        # Create Job instance
-        job = Job(task_graph=task_graph, **job_dict)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in job_keys:
+                pipe.hgetall(key)
+            results = await pipe.execute()
 
-        return job
+        return [self._deserialize_job(fields) for fields in results if fields]
 
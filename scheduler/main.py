@@ -1,32 +1,19 @@
 """FastAPI application entry point for CPA Scheduler."""
 
 import logging
-import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from pathlib import Path
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-# Add current directory to path to support both local and Docker execution
-current_dir = Path(__file__).parent
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
-
-# Try importing with scheduler prefix (local), fall back to direct import (Docker)
-try:
-    from scheduler.api import calculate, jobs
-    from scheduler.config.settings import settings
-    from scheduler.job_queue.job_queue import JobQueue
-except ImportError:
-    from api import calculate, jobs
-    from config.settings import settings
-    from job_queue.job_queue import JobQueue
+from scheduler.api import calculate, jobs
+from scheduler.config.settings import settings
+from scheduler.job_queue.job_queue import JobQueue
 
 # Configure structlog
 structlog.configure(
@@ -44,27 +31,6 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
-# Global state
-job_queue: JobQueue | None = None
-
-
-def get_job_queue() -> JobQueue:
-    """Dependency to get JobQueue instance.
-
-    Returns:
-        JobQueue instance
-
-    Raises:
-        HTTPException: If JobQueue is not initialized
-    """
-    if job_queue is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Job queue not initialized",
-        )
-    return job_queue
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager.
@@ -79,9 +45,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         environment=settings.environment,
     )
 
-    # Initialize Redis connection
-    global job_queue
-    job_queue = JobQueue(redis_url=settings.redis_url)
+    # Initialize Redis connection; routers resolve it from app.state
+    job_queue: JobQueue | None = JobQueue(
+        redis_url=settings.redis_url,
+        max_connections=settings.redis_max_connections,
+    )
     try:
         await job_queue.connect()
         logger.info("redis_connected", redis_url=settings.redis_url)
@@ -89,14 +57,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.error("redis_connection_failed", error=str(e), redis_url=settings.redis_url)
         # Don't fail startup, but log the error
         job_queue = None
+    app.state.job_queue = job_queue
 
-    yield
-
-    # Shutdown
-    logger.info("application_shutdown")
-    if job_queue:
-        await job_queue.close()
-        logger.info("redis_disconnected")
+    try:
+        yield
+    finally:
+        # Shutdown
+        logger.info("application_shutdown")
+        if job_queue:
+            await job_queue.close()
+            logger.info("redis_disconnected")
 
 
 # Create FastAPI app
@@ -116,13 +86,9 @@ app.add_middleware(
     allow_origins=settings.cors_origins_list,
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_methods_list,
-    allow_headers=[settings.cors_allow_headers],
+    allow_headers=settings.cors_allow_headers_list,
 )
 
-# Override dependency functions in routers
-app.dependency_overrides[jobs.get_job_queue] = get_job_queue
-app.dependency_overrides[calculate.get_job_queue] = get_job_queue
-
 # Include routers
 app.include_router(jobs.router)
 app.include_router(calculate.router)
@@ -171,9 +137,12 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
-async def health_check() -> dict[str, Any]:
+async def health_check(request: Request) -> dict[str, Any]:
     """Health check endpoint.
 
+    Args:
+        request: Incoming request
+
     Returns:
         Health status with component checks
     """
@@ -189,6 +158,7 @@ async def health_check() -> dict[str, Any]:
     redis_healthy = False
     redis_component: dict[str, Any] = {}
 
+    job_queue: JobQueue | None = getattr(request.app.state, "job_queue", None)
     if job_queue and job_queue.redis:
         try:
             await job_queue.redis.ping()
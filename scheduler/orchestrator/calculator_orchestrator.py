@@ -1,47 +1,80 @@
 """Calculator Orchestrator - Coordinates calculation and formatting agents."""
 
+import asyncio
 import logging
-import sys
-from pathlib import Path
+import secrets
+from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
 import httpx
+import orjson
 
-# Add scheduler directory to path to support both local and Docker execution
-scheduler_dir = Path(__file__).parent.parent
-if str(scheduler_dir) not in sys.path:
-    sys.path.insert(0, str(scheduler_dir))
-
-# Try importing with scheduler prefix (local), fall back to direct import (Docker)
-try:
-    from scheduler.core.agent_registry import AgentRegistry
-    from scheduler.core.lam_protocol import InformMessage, MessageType, RequestMessage
-    from scheduler.job_queue.job_queue import Job, JobQueue, JobStatus
-except ImportError:
-    from core.agent_registry import AgentRegistry
-    from core.lam_protocol import InformMessage, MessageType, RequestMessage
-    from job_queue.job_queue import Job, JobQueue, JobStatus
+from scheduler.core.agent_registry import AgentRegistry
+from scheduler.core.lam_protocol import MessageType, RequestMessage
+from scheduler.job_queue.job_queue import Job, JobQueue, JobStatus
 
 logger = logging.getLogger(__name__)
 
+# LAM response types checked on every agent reply
+_FAILURE_T = MessageType.FAILURE.value
+_INFORM_T = MessageType.INFORM.value
+
+# HTTP client tuning for agent calls: keep enough warm keep-alive connections
+# that repeat calls to the same agents skip the TCP handshake.
+AGENT_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+AGENT_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=200,
+    keepalive_expiry=60.0,
+)
+
+
+def create_agent_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client for agent calls.
+
+    Meant to be created once per process and shared between orchestrators.
+
+    Returns:
+        Configured HTTP client
+    """
+    return httpx.AsyncClient(timeout=AGENT_HTTP_TIMEOUT, limits=AGENT_HTTP_LIMITS)
+
 
 class CalculatorOrchestrator:
     """Orchestrator for calculator operations."""
 
-    def __init__(self, agent_registry: AgentRegistry, job_queue: JobQueue):
+    SENDER = "agent://orchestrator/calculator"
+
+    # Serialized RequestMessage from this orchestrator; only the per-call fields
+    # are replaced when sending, so no Pydantic model is built per agent call.
+    _REQUEST_TEMPLATE = RequestMessage(sender=SENDER, intent="").to_dict()
+
+    def __init__(
+        self,
+        agent_registry: AgentRegistry,
+        job_queue: JobQueue,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize calculator orchestrator.
 
         Args:
             agent_registry: Agent registry instance
             job_queue: Job queue instance
+            http_client: Shared HTTP client (optional). If omitted, the orchestrator
+                creates and owns its own client.
         """
         self.agent_registry = agent_registry
         self.job_queue = job_queue
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_agent_http_client()
+        # Capability -> agent task URL, dropped again when a call to it fails
+        self._agent_urls: dict[str, str] = {}
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self.http_client.aclose()
+        """Close HTTP client if it is owned by this orchestrator."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
     async def process_calculation_job(self, job: Job) -> None:
         """Process a calculation job.
@@ -49,12 +82,18 @@ class CalculatorOrchestrator:
         Args:
             job: Job to process
         """
-        try:
-            logger.info(f"Processing calculation job: {job.id}")
-
-            # Update job status to running
-            await self.job_queue.update_status(job.id, JobStatus.RUNNING)
+        logger.info(f"Processing calculation job: {job.id}")
+
+        # Mark the job as running in the background so the Redis round-trip
+        # overlaps with the calculation agent call instead of preceding it.
+        # Formatting depends on the calculation result, so those two calls stay serial.
+        # Status writes only touch the status fields, never the stored task graph.
+        job.status = JobStatus.RUNNING
+        mark_running = asyncio.create_task(
+            self.job_queue.update_status(job.id, JobStatus.RUNNING)
+        )
 
+        try:
             # Extract parameters from job result (set by API)
             params = job.result or {}
             num1 = params.get("num1")
@@ -66,7 +105,8 @@ class CalculatorOrchestrator:
             if num1 is None or num2 is None or operator is None:
                 raise ValueError("Missing required parameters: num1, num2, operator")
 
-            conversation_id = str(uuid4())
+            # 64 random bits is plenty to correlate the two agent calls of one job
+            conversation_id = secrets.token_hex(8)
 
             # Step 1: Call calculation agent
             logger.info(f"Calling calculation agent: {num1} {operator} {num2}")
@@ -80,13 +120,14 @@ class CalculatorOrchestrator:
                 calc_result, locale, decimals, conversation_id
             )
 
-            # Update job with final result
+            # Update job with final result (after the RUNNING write has landed)
             result = {
                 **params,
                 "raw_result": calc_result,
                 "formatted_result": formatted_result,
             }
-            await self.job_queue.update_status(job.id, JobStatus.DONE, result=result)
+            await mark_running
+            await self.job_queue.set_result(job.id, result)
 
             logger.info(
                 f"Calculation job completed: {job.id} -> {formatted_result}"
@@ -94,8 +135,11 @@ class CalculatorOrchestrator:
 
         except Exception as e:
             logger.error(f"Calculation job failed: {job.id} - {e}", exc_info=True)
+            job.status = JobStatus.FAILED
             job.error = str(e)
-            await self.job_queue.update_status(job.id, JobStatus.FAILED)
+            # Never let a late RUNNING write overwrite the FAILED status
+            await asyncio.gather(mark_running, return_exceptions=True)
+            await self.job_queue.update_status(job.id, JobStatus.FAILED, error=job.error)
 
     async def _call_calculation_agent(
         self, num1: float, num2: float, operator: str, conversation_id: str
@@ -114,52 +158,14 @@ class CalculatorOrchestrator:
         Raises:
             Exception: If agent call fails
         """
-        # Get calculation agent from registry
-        agent = self.agent_registry.get_agent_by_capability("calculate")
-        if not agent:
-            raise ValueError("Calculation agent not found in registry")
-
-        # Create LAM request message
-        request = RequestMessage(
-            sender="agent://orchestrator/calculator",
-            intent="calculate",
-            payload={
-                "num1": num1,
-                "num2": num2,
-                "operator": operator,
-            },
-            correlation={"conversation_id": conversation_id},
+        result = await self._call_agent(
+            "Calculation agent",
+            "calculate",
+            {"num1": num1, "num2": num2, "operator": operator},
+            conversation_id,
+            "result",
         )
-
-        # Send request to agent
-        try:
-            response = await self.http_client.post(
-                f"{agent.endpoint}/tasks",
-                json=request.to_dict(),
-            )
-            response.raise_for_status()
-
-            # Parse LAM response
-            response_data = response.json()
-
-            # Check if it's a failure message
-            if response_data.get("type") == MessageType.FAILURE.value:
-                error = response_data.get("payload", {}).get("error", "Unknown error")
-                raise ValueError(f"Calculation agent error: {error}")
-
-            # Extract result from inform message
-            if response_data.get("type") != MessageType.INFORM.value:
-                raise ValueError(f"Unexpected message type: {response_data.get('type')}")
-
-            result = response_data.get("payload", {}).get("result")
-            if result is None:
-                raise ValueError("No result in agent response")
-
-            return float(result)
-
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling calculation agent: {e}")
-            raise ValueError(f"Failed to call calculation agent: {e}") from e
+        return float(result)
 
     async def _call_formatting_agent(
         self, value: float, locale: str, decimals: int, conversation_id: str
@@ -178,50 +184,105 @@ class CalculatorOrchestrator:
         Raises:
             Exception: If agent call fails
         """
-        # Get formatting agent from registry
-        agent = self.agent_registry.get_agent_by_capability("format")
-        if not agent:
-            raise ValueError("Formatting agent not found in registry")
-
-        # Create LAM request message
-        request = RequestMessage(
-            sender="agent://orchestrator/calculator",
-            intent="format",
-            payload={
-                "value": value,
-                "locale": locale,
-                "decimals": decimals,
-            },
-            correlation={"conversation_id": conversation_id},
+        formatted = await self._call_agent(
+            "Formatting agent",
+            "format",
+            {"value": value, "locale": locale, "decimals": decimals},
+            conversation_id,
+            "formatted",
         )
+        return str(formatted)
 
-        # Send request to agent
-        try:
-            response = await self.http_client.post(
-                f"{agent.endpoint}/tasks",
-                json=request.to_dict(),
-            )
-            response.raise_for_status()
+    def _build_request(
+        self, intent: str, payload: dict[str, Any], conversation_id: str
+    ) -> dict[str, Any]:
+        """Build a LAM request message dict from the class-level template.
 
-            # Parse LAM response
-            response_data = response.json()
+        Args:
+            intent: Request intent
+            payload: Request payload
+            conversation_id: Conversation ID for tracking
 
-            # Check if it's a failure message
-            if response_data.get("type") == MessageType.FAILURE.value:
-                error = response_data.get("payload", {}).get("error", "Unknown error")
-                raise ValueError(f"Formatting agent error: {error}")
+        Returns:
+            Request message in RequestMessage.to_dict() form
+        """
+        return {
+            **self._REQUEST_TEMPLATE,
+            "id": str(uuid4()),
+            "ts": datetime.now(UTC).isoformat(),
+            "intent": intent,
+            "payload": payload,
+            "correlation": {"conversation_id": conversation_id},
+        }
+
+    async def _call_agent(
+        self,
+        agent_label: str,
+        capability: str,
+        payload: dict[str, Any],
+        conversation_id: str,
+        result_key: str,
+    ) -> Any:
+        """Send a LAM request to the agent for a capability and return one result field.
+
+        The capability doubles as the request intent.
 
-            # Extract result from inform message
-            if response_data.get("type") != MessageType.INFORM.value:
-                raise ValueError(f"Unexpected message type: {response_data.get('type')}")
+        Args:
+            agent_label: Human-readable agent name used in error messages
+            capability: Capability to look up in the registry (and request intent)
+            payload: Request payload
+            conversation_id: Conversation ID for tracking
+            result_key: Key to read from the inform message payload
 
-            formatted = response_data.get("payload", {}).get("formatted")
-            if formatted is None:
-                raise ValueError("No formatted result in agent response")
+        Returns:
+            Value of result_key in the agent's inform payload
 
-            return str(formatted)
+        Raises:
+            ValueError: If the agent is missing, fails, or returns no result
+        """
+        # Get agent URL, from the registry on first use
+        url = self._agent_urls.get(capability)
+        if url is None:
+            agent = self.agent_registry.get_agent_by_capability(capability)
+            if not agent:
+                raise ValueError(f"{agent_label} not found in registry")
+            url = self._agent_urls[capability] = f"{agent.endpoint}/tasks"
 
+        # Send request to agent
+        try:
+            response = await self.http_client.post(
+                url,
+                json=self._build_request(capability, payload, conversation_id),
+            )
+            if not response.is_success:
+                raise httpx.HTTPStatusError(
+                    f"Agent returned HTTP {response.status_code} for {url}",
+                    request=response.request,
+                    response=response,
+                )
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling formatting agent: {e}")
-            raise ValueError(f"Failed to call formatting agent: {e}") from e
+            # Look the agent up again next time in case it was re-registered
+            self._agent_urls.pop(capability, None)
+            logger.error(f"HTTP error calling {agent_label.lower()}: {e}")
+            raise ValueError(f"Failed to call {agent_label.lower()}: {e}") from e
+
+        # Parse LAM response
+        response_data = orjson.loads(response.content)
+        message_type = response_data.get("type")
+
+        # Extract result from inform message (the common case, checked first)
+        if message_type == _INFORM_T:
+            try:
+                result = response_data["payload"][result_key]
+            except KeyError:
+                result = None
+            if result is None:
+                raise ValueError(f"Missing '{result_key}' in {agent_label.lower()} response")
+            return result
+
+        # Check if it's a failure message
+        if message_type == _FAILURE_T:
+            error = response_data.get("payload", {}).get("error", "Unknown error")
+            raise ValueError(f"{agent_label} error: {error}")
 
+        raise ValueError(f"Unexpected message type: {message_type}")
@@ -3,35 +3,51 @@
 import asyncio
 import logging
 import os
+import queue
 import signal
 import sys
-from pathlib import Path
-
-# Add scheduler directory to path to support both local and Docker execution
-scheduler_dir = Path(__file__).parent.parent
-if str(scheduler_dir) not in sys.path:
-    sys.path.insert(0, str(scheduler_dir))
-
-# Try importing with scheduler prefix (local), fall back to direct import (Docker)
-try:
-    from scheduler.core.agent_registry import AgentRegistry
-    from scheduler.orchestrator.calculator_orchestrator import CalculatorOrchestrator
-    from scheduler.job_queue.job_queue import JobQueue, JobStatus
-except ImportError:
-    from core.agent_registry import AgentRegistry
-    from orchestrator.calculator_orchestrator import CalculatorOrchestrator
-    from job_queue.job_queue import JobQueue, JobStatus
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+from logging.handlers import QueueHandler, QueueListener
+
+from scheduler.core.agent_registry import AgentRegistry
+from scheduler.job_queue.job_queue import JobQueue
+from scheduler.orchestrator.calculator_orchestrator import (
+    CalculatorOrchestrator,
+    create_agent_http_client,
 )
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 logger = logging.getLogger(__name__)
 
 # Global flag for graceful shutdown
 shutdown_flag = False
 
+# Seconds to block waiting for a job; bounds how long shutdown waits for the loop
+DEQUEUE_TIMEOUT = 5
+
+
+def configure_logging() -> QueueListener:
+    """Configure logging so records are written from a background thread.
+
+    Log calls only put the record on a queue; the returned listener formats and
+    writes it, keeping stream I/O off the event loop.
+
+    Returns:
+        Started listener; stop it on shutdown to flush pending records
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    # The queue handler only merges the message and enqueues it; the listener
+    # applies LOG_FORMAT and does the write
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
 
 def signal_handler(signum, frame):
     """Handle shutdown signals."""
@@ -51,20 +67,8 @@ async def main():
     # Get Redis URL from environment
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
 
-    # Get agents config path (different for local vs Docker)
-    agents_config = os.getenv("AGENTS_CONFIG")
-    if not agents_config:
-        # Try to find the config file
-        possible_paths = [
-            "scheduler/config/agents.yaml",  # Local execution
-            "config/agents.yaml",  # Docker execution
-        ]
-        for path in possible_paths:
-            if Path(path).exists():
-                agents_config = path
-                break
-        if not agents_config:
-            agents_config = "config/agents.yaml"  # Default to Docker path
+    # Get agents config path (relative to the project root, locally and in Docker)
+    agents_config = os.getenv("AGENTS_CONFIG", "scheduler/config/agents.yaml")
 
     logger.info("Starting calculator worker...")
     logger.info(f"Redis URL: {redis_url}")
@@ -75,7 +79,8 @@ async def main():
     await job_queue.connect()
 
     agent_registry = AgentRegistry(agents_config)
-    orchestrator = CalculatorOrchestrator(agent_registry, job_queue)
+    http_client = create_agent_http_client()
+    orchestrator = CalculatorOrchestrator(agent_registry, job_queue, http_client=http_client)
 
     logger.info(f"Loaded {len(agent_registry.list_agents())} agents")
     logger.info("Worker ready, waiting for jobs...")
@@ -83,26 +88,22 @@ async def main():
     try:
         while not shutdown_flag:
             try:
-                # Dequeue job
-                job = await job_queue.dequeue()
-
-                if job:
-                    logger.info(f"Processing job: {job.id} (intent: {job.intent})")
-
-                    # Only process calculate intent
-                    if job.intent == "calculate":
-                        await orchestrator.process_calculation_job(job)
-                    else:
-                        logger.warning(f"Unknown intent: {job.intent}, skipping job {job.id}")
-                        await job_queue.update_status(job.id, JobStatus.FAILED)
-                        job.error = f"Unknown intent: {job.intent}"
-                        await job_queue._save_job(job)
+                # Wait for the next job; Redis wakes us as soon as one is enqueued
+                job = await job_queue.dequeue_blocking(timeout=DEQUEUE_TIMEOUT)
+                if not job:
+                    continue
+
+                logger.info("Processing job: %s (intent: %s)", job.id, job.intent)
+
+                # Only process calculate intent
+                if job.intent == "calculate":
+                    await orchestrator.process_calculation_job(job)
                 else:
-                    # No job available, wait a bit
-                    await asyncio.sleep(1)
+                    logger.warning("Unknown intent: %s, skipping job %s", job.intent, job.id)
+                    await job_queue.mark_failed(job, f"Unknown intent: {job.intent}")
 
             except Exception as e:
-                logger.error(f"Error processing job: {e}", exc_info=True)
+                logger.error("Error processing job: %s", e, exc_info=True)
                 await asyncio.sleep(1)
 
     except KeyboardInterrupt:
@@ -110,14 +111,18 @@ async def main():
     finally:
         logger.info("Shutting down worker...")
         await orchestrator.close()
+        await http_client.aclose()
         await job_queue.close()
         logger.info("Worker shutdown complete")
 
 
 if __name__ == "__main__":
+    log_listener = configure_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Worker stopped")
         sys.exit(0)
+    finally:
+        log_listener.stop()
 
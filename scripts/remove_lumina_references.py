@@ -6,6 +6,8 @@ This script replaces all references to Lumina, Agentify, and LAM with Agentify e
 
 import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict
 
@@ -38,6 +40,26 @@ REPLACEMENTS: Dict[str, str] = {
     "agentify.dev": "agentify.dev",
 }
 
+# Files are matched as UTF-8 bytes, which skips decoding and re-encoding them
+REPLACEMENTS_BYTES: Dict[bytes, bytes] = {
+    old.encode("utf-8"): new.encode("utf-8") for old, new in REPLACEMENTS.items()
+}
+
+# All keys in one alternation, so each file is scanned once. Longer keys come
+# first so they win over keys that are their prefixes.
+REPLACEMENT_PATTERN = re.compile(
+    b"|".join(re.escape(old) for old in sorted(REPLACEMENTS_BYTES, key=len, reverse=True))
+)
+
+# Files smaller than the shortest key cannot contain a match
+MIN_KEY_LENGTH = min(map(len, REPLACEMENTS_BYTES))
+
+
+def _replacement(match: re.Match) -> bytes:
+    """Return the replacement for a matched key."""
+    return REPLACEMENTS_BYTES[match.group(0)]
+
+
 # File extensions to process
 EXTENSIONS = {
     ".py", ".md", ".ts", ".tsx", ".js", ".jsx", 
@@ -51,43 +73,32 @@ EXCLUDE_DIRS = {
 }
 
 
-def should_process_file(file_path: Path) -> bool:
-    """Check if file should be processed."""
-    # Check extension
-    if file_path.suffix not in EXTENSIONS:
-        return False
-    
-    # Check if in excluded directory
-    for part in file_path.parts:
-        if part in EXCLUDE_DIRS:
-            return False
-    
-    return True
+def walk_files(root: Path) -> Iterator[Path]:
+    """Yield files to process below root, without descending into excluded dirs."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDE_DIRS:
+                    yield from walk_files(Path(entry.path))
+            elif entry.is_file(follow_symlinks=False) and os.path.splitext(entry.name)[1] in EXTENSIONS:
+                yield Path(entry.path)
 
 
 def process_file(file_path: Path) -> int:
     """Process a single file and return number of replacements."""
     try:
-        # Read file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Skip files too small to contain any key without reading them
+        if file_path.stat().st_size < MIN_KEY_LENGTH:
+            return 0
         
-        original_content = content
-        replacements_count = 0
+        data = file_path.read_bytes()
         
-        # Apply all replacements
-        for old, new in REPLACEMENTS.items():
-            # Escape special regex characters
-            pattern = re.escape(old)
-            matches = re.findall(pattern, content)
-            if matches:
-                content = re.sub(pattern, new, content)
-                replacements_count += len(matches)
+        # Apply all replacements in a single pass
+        new_data, replacements_count = REPLACEMENT_PATTERN.subn(_replacement, data)
         
-        # Save if modified
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        # Save only if modified
+        if replacements_count and new_data != data:
+            file_path.write_bytes(new_data)
             return replacements_count
         
         return 0
@@ -107,10 +118,7 @@ def main():
     
     # Find all files
     print("📂 Scanning files...")
-    files = [
-        f for f in project_root.rglob("*")
-        if f.is_file() and should_process_file(f)
-    ]
+    files = list(walk_files(project_root))
     
     print(f"📝 Found {len(files)} files to process")
     print()
@@ -119,8 +127,11 @@ def main():
     total_replacements = 0
     files_modified = 0
     
-    for file_path in files:
-        replacements = process_file(file_path)
+    # Files are independent, so they are processed in parallel across cores
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, files, chunksize=64))
+    
+    for file_path, replacements in zip(files, results, strict=True):
         if replacements > 0:
             files_modified += 1
             total_replacements += replacements
@@ -12,11 +12,26 @@ from agents.desktop_rpa.server_comm.models import (
     AgentRegistrationResponse,
 )
 from server.core.config import settings
-from server.db.database import get_db
+from server.core.security import hash_api_key
+from server.db.database import get_db, get_read_db
 from server.db.models import Agent
 
 router = APIRouter()
 
+# Columns returned by list_agents. They are selected directly, so rows come back
+# as tuples instead of full Agent objects tracked by the session.
+AGENT_LIST_COLUMNS = (
+    Agent.id,
+    Agent.hostname,
+    Agent.os_name,
+    Agent.os_version,
+    Agent.ip_address,
+    Agent.registered_at,
+    Agent.last_seen_at,
+    Agent.is_active,
+    Agent.current_task,
+)
+
 
 def generate_agent_id() -> str:
     """Generate unique agent ID."""
@@ -49,7 +64,7 @@ async def register_agent(
     # Create agent record
     agent = Agent(
         id=agent_id,
-        api_key=api_key,
+        api_key_hash=hash_api_key(api_key),
         os_name=request.agent_info.os_name,
         os_version=request.agent_info.os_version,
         os_build=request.agent_info.os_build,
@@ -72,21 +87,20 @@ async def register_agent(
     
     db.add(agent)
     await db.commit()
-    await db.refresh(agent)
     
     # Return registration response
     return AgentRegistrationResponse(
         agent_id=agent_id,
         api_key=api_key,
-        server_url=f"http://{settings.HOST}:{settings.PORT}",
-        websocket_url=f"ws://{settings.HOST}:{settings.PORT}/ws",
+        server_url=settings.server_url,
+        websocket_url=settings.websocket_url,
         registered_at=agent.registered_at,
     )
 
 
 @router.get("/")
 async def list_agents(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
 ):
@@ -101,30 +115,19 @@ async def list_agents(
         List of agents
     """
     result = await db.execute(
-        select(Agent).offset(skip).limit(limit).order_by(Agent.registered_at.desc())
+        select(*AGENT_LIST_COLUMNS)
+        .offset(skip)
+        .limit(limit)
+        .order_by(Agent.registered_at.desc())
     )
-    agents = result.scalars().all()
     
-    return [
-        {
-            "id": agent.id,
-            "hostname": agent.hostname,
-            "os_name": agent.os_name,
-            "os_version": agent.os_version,
-            "ip_address": agent.ip_address,
-            "registered_at": agent.registered_at,
-            "last_seen_at": agent.last_seen_at,
-            "is_active": agent.is_active,
-            "current_task": agent.current_task,
-        }
-        for agent in agents
-    ]
+    return [row._asdict() for row in result]
 
 
 @router.get("/{agent_id}")
 async def get_agent(
     agent_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get agent details.
     
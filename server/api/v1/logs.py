@@ -1,24 +1,27 @@
 """Log management endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agents.desktop_rpa.server_comm.models import LogEntry as LogEntryModel
-from server.db.database import get_db
+from server.core.config import settings
+from server.core.security import hash_api_key
+from server.db.database import get_db, get_read_db
 from server.db.models import Agent, LogEntry
 
 router = APIRouter()
 
 
-async def verify_api_key(authorization: str = Header(...), db: AsyncSession = Depends(get_db)) -> str:
-    """Verify API key and return agent ID.
+async def verify_api_key(authorization: str = Header(...), db: AsyncSession = Depends(get_db)) -> Agent:
+    """Verify API key and return the agent it belongs to.
     
     Args:
         authorization: Authorization header (Bearer token)
         db: Database session
         
     Returns:
-        Agent ID
+        Agent, attached to the request's database session
         
     Raises:
         HTTPException: If API key is invalid
@@ -28,37 +31,37 @@ async def verify_api_key(authorization: str = Header(...), db: AsyncSession = De
     
     api_key = authorization.replace("Bearer ", "")
     
-    result = await db.execute(select(Agent).where(Agent.api_key == api_key))
+    result = await db.execute(select(Agent).where(Agent.api_key_hash == hash_api_key(api_key)))
     agent = result.scalar_one_or_none()
     
     if not agent:
         raise HTTPException(status_code=401, detail="Invalid API key")
     
-    # Update last seen
-    agent.last_seen_at = LogEntry.timestamp
-    await db.commit()
+    # Update last seen. The endpoint's commit writes it together with its own
+    # changes, so authentication adds no commit of its own.
+    agent.last_seen_at = func.now()
     
-    return agent.id
+    return agent
 
 
 @router.post("/")
 async def create_log(
     log: LogEntryModel,
     db: AsyncSession = Depends(get_db),
-    agent_id: str = Depends(verify_api_key),
+    agent: Agent = Depends(verify_api_key),
 ):
     """Create a new log entry.
     
     Args:
         log: Log entry data
         db: Database session
-        agent_id: Agent ID (from API key)
+        agent: Agent (from API key)
         
     Returns:
         Created log entry
     """
     # Verify agent ID matches
-    if log.agent_id != agent_id:
+    if log.agent_id != agent.id:
         raise HTTPException(status_code=403, detail="Agent ID mismatch")
     
     # Create log entry
@@ -73,21 +76,67 @@ async def create_log(
     
     db.add(log_entry)
     
-    # Update agent's current task
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
-    if agent and log.task_goal:
+    # Update agent's current task; the agent was loaded by verify_api_key in
+    # the same session, so no second SELECT is needed
+    if log.task_goal:
         agent.current_task = log.task_goal
     
     await db.commit()
-    await db.refresh(log_entry)
     
     return {"id": log_entry.id, "status": "created"}
 
 
+@router.post("/batch")
+async def create_logs_batch(
+    logs: list[LogEntryModel],
+    db: AsyncSession = Depends(get_db),
+    agent: Agent = Depends(verify_api_key),
+):
+    """Create several log entries in one request.
+    
+    All entries are inserted with a single executemany and committed together.
+    
+    Args:
+        logs: Log entries, oldest first
+        db: Database session
+        agent: Agent (from API key)
+        
+    Returns:
+        Number of created log entries
+    """
+    # Verify agent ID matches for every entry before inserting any
+    if any(log.agent_id != agent.id for log in logs):
+        raise HTTPException(status_code=403, detail="Agent ID mismatch")
+    
+    if logs:
+        await db.execute(
+            insert(LogEntry),
+            [
+                {
+                    "agent_id": log.agent_id,
+                    "timestamp": log.timestamp,
+                    "level": log.level,
+                    "message": log.message,
+                    "task_goal": log.task_goal,
+                    "extra_data": log.metadata,  # Renamed from 'metadata'
+                }
+                for log in logs
+            ],
+        )
+    
+    # Update agent's current task from the newest entry that has one
+    task_goal = next((log.task_goal for log in reversed(logs) if log.task_goal), None)
+    if task_goal:
+        agent.current_task = task_goal
+    
+    await db.commit()
+    
+    return {"count": len(logs), "status": "created"}
+
+
 @router.get("/")
 async def list_logs(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     agent_id: str | None = None,
     level: str | None = None,
     skip: int = 0,
@@ -118,7 +167,9 @@ async def list_logs(
     result = await db.execute(query)
     logs = result.scalars().all()
     
-    return [
+    # Rows are plain JSON types, so orjson encodes them directly without a
+    # jsonable_encoder pass
+    return ORJSONResponse([
         {
             "id": log.id,
             "agent_id": log.agent_id,
@@ -129,34 +180,40 @@ async def list_logs(
             "metadata": log.extra_data,  # Renamed from 'metadata'
         }
         for log in logs
-    ]
+    ])
 
 
 @router.get("/{agent_id}/stream")
 async def stream_logs(
     agent_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     since_id: int = 0,
 ):
     """Stream logs for an agent since a specific ID.
     
+    At most MAX_LOG_STREAM_BATCH entries are returned per call; poll again with
+    the last returned ID to get the rest.
+    
     Args:
         agent_id: Agent ID
         db: Database session
         since_id: Return logs with ID greater than this
         
     Returns:
-        List of new log entries
+        List of new log entries, oldest first
     """
+    # Ordering by id (assigned in insert order) lets the (agent_id, id) index
+    # serve both the filter and the sort
     result = await db.execute(
         select(LogEntry)
         .where(LogEntry.agent_id == agent_id)
         .where(LogEntry.id > since_id)
-        .order_by(LogEntry.timestamp.asc())
+        .order_by(LogEntry.id.asc())
+        .limit(settings.MAX_LOG_STREAM_BATCH)
     )
     logs = result.scalars().all()
     
-    return [
+    return ORJSONResponse([
         {
             "id": log.id,
             "timestamp": log.timestamp,
@@ -166,5 +223,5 @@ async def stream_logs(
             "metadata": log.extra_data,  # Renamed from 'metadata'
         }
         for log in logs
-    ]
+    ])
 
@@ -1,25 +1,117 @@
 """Screenshot management endpoints."""
+import shutil
+import time
+from datetime import datetime
 from pathlib import Path
+from typing import Any, BinaryIO
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from agents.desktop_rpa.server_comm.models import ScreenshotUpload
 from server.api.v1.logs import verify_api_key
 from server.core.config import settings
-from server.db.database import get_db
-from server.db.models import Screenshot
+from server.db.database import get_db, get_read_db
+from server.db.models import Agent, Screenshot
 
 router = APIRouter()
 
+# Screenshots are stored under SCREENSHOT_ROOT/<agent_id>/<filename>
+SCREENSHOT_ROOT = Path(settings.SCREENSHOT_DIR)
+
+# Bytes read from an upload and written to disk per step
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Columns returned by the list endpoints. They are selected directly, so rows
+# come back as mappings instead of full Screenshot objects.
+SCREENSHOT_LIST_COLUMNS = (
+    Screenshot.id,
+    Screenshot.agent_id,
+    Screenshot.timestamp,
+    Screenshot.action_type,
+    Screenshot.mouse_x,
+    Screenshot.mouse_y,
+    Screenshot.task_goal,
+    Screenshot.filename,
+    Screenshot.file_size_bytes,
+)
+LATEST_SCREENSHOT_COLUMNS = (
+    Screenshot.id,
+    Screenshot.timestamp,
+    Screenshot.action_type,
+    Screenshot.mouse_x,
+    Screenshot.mouse_y,
+    Screenshot.task_goal,
+    Screenshot.filename,
+)
+
+# Listing responses are cached briefly, since dashboards poll them with the same
+# parameters. Each key carries the version of the agent it lists (None for all
+# agents). An upload bumps its agent's version and the global one, so a process
+# never serves listings older than its own uploads.
+LIST_CACHE_TTL_SECONDS = 2.0
+LIST_CACHE_MAX_ENTRIES = 1024
+_list_cache: dict[tuple, tuple[float, list[dict[str, Any]]]] = {}
+_list_versions: dict[str | None, int] = {}
+
+
+def _listing_key(kind: str, agent_id: str | None, *params: Any) -> tuple:
+    """Build the cache key for a listing of one agent (or all agents)."""
+    return (kind, agent_id, _list_versions.get(agent_id, 0), *params)
+
+
+def _get_cached_listing(key: tuple) -> list[dict[str, Any]] | None:
+    """Return a cached listing, or None if it is missing or expired."""
+    entry = _list_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def _cache_listing(key: tuple, rows: list[dict[str, Any]]) -> None:
+    """Cache a listing for LIST_CACHE_TTL_SECONDS."""
+    if len(_list_cache) >= LIST_CACHE_MAX_ENTRIES:
+        _list_cache.clear()
+    _list_cache[key] = (time.monotonic() + LIST_CACHE_TTL_SECONDS, rows)
+
+
+def _invalidate_listings(agent_id: str) -> None:
+    """Make cached listings that could include agent_id's screenshots unreachable."""
+    _list_versions[agent_id] = _list_versions.get(agent_id, 0) + 1
+    _list_versions[None] = _list_versions.get(None, 0) + 1
+
+
+def _save_upload(source: BinaryIO, file_path: Path) -> None:
+    """Copy an uploaded file to disk in chunks.
+    
+    The parent directory is only created when opening the file fails because it
+    is missing, so uploads to an existing directory cost no mkdir call.
+    
+    Blocking; call it through run_in_threadpool.
+    
+    Args:
+        source: Uploaded file object (UploadFile.file)
+        file_path: Destination path
+    """
+    try:
+        f = file_path.open("wb")
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        f = file_path.open("wb")
+    
+    with f:
+        shutil.copyfileobj(source, f, UPLOAD_CHUNK_SIZE)
+
 
 @router.post("/")
 async def upload_screenshot(
     file: UploadFile = File(...),
     metadata: str = Form(...),
     db: AsyncSession = Depends(get_db),
-    agent_id: str = Depends(verify_api_key),
+    agent: Agent = Depends(verify_api_key),
 ):
     """Upload a screenshot.
     
@@ -27,11 +119,13 @@ async def upload_screenshot(
         file: Screenshot file
         metadata: Screenshot metadata (JSON)
         db: Database session
-        agent_id: Agent ID (from API key)
+        agent: Agent (from API key)
         
     Returns:
         Upload confirmation
     """
+    agent_id = agent.id
+    
     # Parse metadata
     screenshot_meta = ScreenshotUpload.model_validate_json(metadata)
     
@@ -39,35 +133,36 @@ async def upload_screenshot(
     if screenshot_meta.agent_id != agent_id:
         raise HTTPException(status_code=403, detail="Agent ID mismatch")
     
-    # Save file
-    screenshot_dir = Path(settings.SCREENSHOT_DIR) / agent_id
-    screenshot_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = screenshot_dir / screenshot_meta.filename
-    
-    with file_path.open("wb") as f:
-        content = await file.read()
-        f.write(content)
-    
-    # Create database record
-    screenshot = Screenshot(
-        agent_id=screenshot_meta.agent_id,
-        timestamp=screenshot_meta.timestamp,
-        action_type=screenshot_meta.action_type,
-        mouse_x=screenshot_meta.mouse_x,
-        mouse_y=screenshot_meta.mouse_y,
-        task_goal=screenshot_meta.task_goal,
-        filename=screenshot_meta.filename,
-        file_path=str(file_path),
-        file_size_bytes=screenshot_meta.file_size_bytes,
-    )
+    # Save file (_save_upload creates the agent's directory on first upload)
+    file_path = SCREENSHOT_ROOT / agent_id / screenshot_meta.filename
     
-    db.add(screenshot)
+    # The whole copy runs in one threadpool call, so the event loop keeps
+    # serving other requests and memory stays at one chunk per upload
+    await run_in_threadpool(_save_upload, file.file, file_path)
+    
+    # Create database record; RETURNING hands back the new id, so the row does
+    # not have to be read again after the commit
+    result = await db.execute(
+        insert(Screenshot)
+        .values(
+            agent_id=screenshot_meta.agent_id,
+            timestamp=screenshot_meta.timestamp,
+            action_type=screenshot_meta.action_type,
+            mouse_x=screenshot_meta.mouse_x,
+            mouse_y=screenshot_meta.mouse_y,
+            task_goal=screenshot_meta.task_goal,
+            filename=screenshot_meta.filename,
+            file_path=str(file_path),
+            file_size_bytes=screenshot_meta.file_size_bytes,
+        )
+        .returning(Screenshot.id)
+    )
+    screenshot_id = result.scalar_one()
     await db.commit()
-    await db.refresh(screenshot)
+    _invalidate_listings(agent_id)
     
     return {
-        "id": screenshot.id,
+        "id": screenshot_id,
         "status": "uploaded",
         "url": f"/screenshots/{agent_id}/{screenshot_meta.filename}",
     }
@@ -75,13 +170,19 @@ async def upload_screenshot(
 
 @router.get("/")
 async def list_screenshots(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     agent_id: str | None = None,
     action_type: str | None = None,
     skip: int = 0,
     limit: int = 100,
+    after_timestamp: datetime | None = None,
+    after_id: int | None = None,
 ):
-    """List screenshots.
+    """List screenshots, newest first.
+    
+    To page, pass the timestamp and id of the last screenshot of the previous
+    page as after_timestamp/after_id. Unlike skip, this costs the same on every
+    page.
     
     Args:
         db: Database session
@@ -89,11 +190,29 @@ async def list_screenshots(
         action_type: Filter by action type
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after_timestamp: Timestamp of the last screenshot already seen
+        after_id: ID of the last screenshot already seen
         
     Returns:
         List of screenshots
+        
+    Raises:
+        HTTPException: If only one of after_timestamp and after_id is given
     """
-    query = select(Screenshot)
+    if (after_timestamp is None) != (after_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="after_timestamp and after_id must be given together",
+        )
+    
+    cache_key = _listing_key(
+        "list", agent_id or None, action_type, skip, limit, after_timestamp, after_id
+    )
+    cached = _get_cached_listing(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    query = select(*SCREENSHOT_LIST_COLUMNS)
     
     if agent_id:
         query = query.where(Screenshot.agent_id == agent_id)
@@ -101,32 +220,34 @@ async def list_screenshots(
     if action_type:
         query = query.where(Screenshot.action_type == action_type)
     
-    query = query.offset(skip).limit(limit).order_by(Screenshot.timestamp.desc())
+    if after_timestamp is not None:
+        query = query.where(
+            tuple_(Screenshot.timestamp, Screenshot.id) < tuple_(after_timestamp, after_id)
+        )
+    
+    # id breaks timestamp ties, so keyset pages neither skip nor repeat rows
+    query = (
+        query.offset(skip)
+        .limit(limit)
+        .order_by(Screenshot.timestamp.desc(), Screenshot.id.desc())
+    )
     
     result = await db.execute(query)
-    screenshots = result.scalars().all()
-    
-    return [
-        {
-            "id": screenshot.id,
-            "agent_id": screenshot.agent_id,
-            "timestamp": screenshot.timestamp,
-            "action_type": screenshot.action_type,
-            "mouse_x": screenshot.mouse_x,
-            "mouse_y": screenshot.mouse_y,
-            "task_goal": screenshot.task_goal,
-            "filename": screenshot.filename,
-            "file_size_bytes": screenshot.file_size_bytes,
-            "url": f"/screenshots/{screenshot.agent_id}/{screenshot.filename}",
-        }
-        for screenshot in screenshots
+    
+    screenshots = [
+        {**row, "url": f"/screenshots/{row['agent_id']}/{row['filename']}"}
+        for row in result.mappings()
     ]
+    _cache_listing(cache_key, screenshots)
+    # Rows hold only JSON-native values, so orjson encodes them directly without
+    # a jsonable_encoder pass
+    return ORJSONResponse(screenshots)
 
 
 @router.get("/{agent_id}/latest")
 async def get_latest_screenshots(
     agent_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     limit: int = 10,
 ):
     """Get latest screenshots for an agent.
@@ -139,25 +260,22 @@ async def get_latest_screenshots(
     Returns:
         List of latest screenshots
     """
+    cache_key = _listing_key("latest", agent_id, limit)
+    cached = _get_cached_listing(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     result = await db.execute(
-        select(Screenshot)
+        select(*LATEST_SCREENSHOT_COLUMNS)
         .where(Screenshot.agent_id == agent_id)
         .order_by(Screenshot.timestamp.desc())
         .limit(limit)
     )
-    screenshots = result.scalars().all()
-    
-    return [
-        {
-            "id": screenshot.id,
-            "timestamp": screenshot.timestamp,
-            "action_type": screenshot.action_type,
-            "mouse_x": screenshot.mouse_x,
-            "mouse_y": screenshot.mouse_y,
-            "task_goal": screenshot.task_goal,
-            "filename": screenshot.filename,
-            "url": f"/screenshots/{agent_id}/{screenshot.filename}",
-        }
-        for screenshot in screenshots
+    
+    screenshots = [
+        {**row, "url": f"/screenshots/{agent_id}/{row['filename']}"}
+        for row in result.mappings()
     ]
+    _cache_listing(cache_key, screenshots)
+    return ORJSONResponse(screenshots)
 
@@ -1,4 +1,5 @@
 """Server configuration."""
+from functools import cached_property
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +25,9 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./cpa_server.db"
+    READ_DATABASE_URL: str | None = None  # Read replica; defaults to DATABASE_URL
+    READ_POOL_SIZE: int = 20
+    READ_MAX_OVERFLOW: int = 40
     
     # Storage
     UPLOAD_DIR: str = "./uploads"
@@ -35,6 +39,19 @@ class Settings(BaseSettings):
     
     # Agent
     AGENT_TIMEOUT_SECONDS: int = 300  # 5 minutes
+    
+    # Logs
+    MAX_LOG_STREAM_BATCH: int = 500  # Max entries returned per stream poll
+    
+    @cached_property
+    def server_url(self) -> str:
+        """Base URL handed to agents on registration."""
+        return f"http://{self.HOST}:{self.PORT}"
+    
+    @cached_property
+    def websocket_url(self) -> str:
+        """WebSocket URL handed to agents on registration."""
+        return f"ws://{self.HOST}:{self.PORT}/ws"
 
 
 settings = Settings()
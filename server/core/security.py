@@ -0,0 +1,20 @@
+"""API key hashing."""
+import hashlib
+
+# BLAKE2b digest size in bytes (128 bits)
+API_KEY_DIGEST_SIZE = 16
+
+
+def hash_api_key(api_key: str) -> bytes:
+    """Hash an API key for storage and lookup.
+    
+    Keys are long random tokens, so an unsalted fast digest is enough to keep
+    them from being readable at rest while still allowing an indexed lookup.
+    
+    Args:
+        api_key: API key as issued to the agent
+        
+    Returns:
+        Fixed-size digest stored in Agent.api_key_hash
+    """
+    return hashlib.blake2b(api_key.encode(), digest_size=API_KEY_DIGEST_SIZE).digest()
@@ -1,8 +1,11 @@
 """Database setup and session management."""
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from server.core.config import settings
+from server.core.security import hash_api_key
 
 # Create async engine
 engine = create_async_engine(
@@ -11,21 +14,103 @@ engine = create_async_engine(
     future=True,
 )
 
-# Create async session factory
+# Separate engine for the read-only endpoints, so bursts of list/poll requests
+# cannot take every connection the write path needs. It uses the replica when
+# READ_DATABASE_URL is set. Pool sizing only applies to server databases, and an
+# in-memory SQLite database exists per connection, so there the write engine
+# is shared.
+read_url = make_url(settings.READ_DATABASE_URL or settings.DATABASE_URL)
+if read_url.get_backend_name() != "sqlite":
+    read_engine = create_async_engine(
+        read_url,
+        echo=settings.DEBUG,
+        future=True,
+        pool_size=settings.READ_POOL_SIZE,
+        max_overflow=settings.READ_MAX_OVERFLOW,
+    )
+elif read_url.database in (None, "", ":memory:") or read_url.query.get("mode") == "memory":
+    read_engine = engine
+else:
+    read_engine = create_async_engine(read_url, echo=settings.DEBUG, future=True)
+
+# SQLite tuning applied to every new connection. WAL lets readers run while a
+# write is in progress, and with synchronous=NORMAL commits no longer fsync
+# (only checkpoints do).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+for _engine in {engine, read_engine}:
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# Create async session factories
 AsyncSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
+ReadSessionLocal = sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 
 # Base class for models
 Base = declarative_base()
 
 
+def _migrate_api_key_hash(connection):
+    """Replace the plaintext agents.api_key column with api_key_hash.
+    
+    Databases created before API keys were hashed still have the old column.
+    The digests are computed from the stored keys, so registered agents keep
+    working, and the plaintext keys are dropped. Does nothing on databases
+    that are already migrated.
+    """
+    columns = {column["name"] for column in inspect(connection).get_columns("agents")}
+    if "api_key" not in columns:
+        return
+    
+    agents = Base.metadata.tables["agents"]
+    api_key_hash = agents.c.api_key_hash
+    if "api_key_hash" not in columns:
+        column_type = api_key_hash.type.compile(dialect=connection.dialect)
+        connection.execute(text(f"ALTER TABLE agents ADD COLUMN api_key_hash {column_type}"))
+    
+    rows = connection.execute(text("SELECT id, api_key FROM agents")).all()
+    if rows:
+        connection.execute(
+            text("UPDATE agents SET api_key_hash = :api_key_hash WHERE id = :id"),
+            [{"id": agent_id, "api_key_hash": hash_api_key(api_key)} for agent_id, api_key in rows],
+        )
+    
+    # The old unique index has to go before its column can be dropped
+    connection.execute(text("DROP INDEX IF EXISTS ix_agents_api_key"))
+    connection.execute(text("ALTER TABLE agents DROP COLUMN api_key"))
+    for index in agents.indexes:
+        if api_key_hash in index.columns.values():
+            index.create(connection, checkfirst=True)
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_migrate_api_key_hash)
 
 
 async def get_db() -> AsyncSession:
@@ -33,3 +118,9 @@ async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         yield session
 
+
+async def get_read_db() -> AsyncSession:
+    """Get database session for read-only endpoints."""
+    async with ReadSessionLocal() as session:
+        yield session
+
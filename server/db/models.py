@@ -1,9 +1,10 @@
 """Database models."""
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Float, Integer, String, Text, Boolean
+from sqlalchemy import JSON, Column, DateTime, Float, Index, Integer, LargeBinary, String, Text, Boolean
 from sqlalchemy.sql import func
 
+from server.core.security import API_KEY_DIGEST_SIZE
 from server.db.database import Base
 
 
@@ -13,7 +14,8 @@ class Agent(Base):
     __tablename__ = "agents"
     
     id = Column(String, primary_key=True, index=True)
-    api_key = Column(String, unique=True, index=True, nullable=False)
+    # Only a digest of the API key is stored (see server.core.security)
+    api_key_hash = Column(LargeBinary(API_KEY_DIGEST_SIZE), unique=True, index=True, nullable=False)
     
     # System info
     os_name = Column(String, nullable=False)
@@ -53,9 +55,17 @@ class LogEntry(Base):
     """Log entry model."""
 
     __tablename__ = "log_entries"
+    __table_args__ = (
+        # Serves agent_id lookups and stream_logs polling
+        # (agent_id = ? AND id > ? ORDER BY id) without a sort step
+        Index("ix_log_entries_agent_id_id", "agent_id", "id"),
+        # Serves list_logs for one agent, newest first; timestamps come from the
+        # agents, so they need not follow id order
+        Index("ix_log_entries_agent_id_timestamp", "agent_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    agent_id = Column(String, index=True, nullable=False)
+    agent_id = Column(String, nullable=False)
 
     timestamp = Column(DateTime, server_default=func.now(), nullable=False)
     level = Column(String, nullable=False)
@@ -68,9 +78,14 @@ class Screenshot(Base):
     """Screenshot model."""
     
     __tablename__ = "screenshots"
+    __table_args__ = (
+        # Serves agent_id lookups and the latest-screenshots query
+        # (agent_id = ? ORDER BY timestamp DESC LIMIT ?) without a sort step
+        Index("ix_screenshots_agent_id_timestamp", "agent_id", "timestamp"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    agent_id = Column(String, index=True, nullable=False)
+    agent_id = Column(String, nullable=False)
     
     timestamp = Column(DateTime, server_default=func.now(), nullable=False)
     action_type = Column(String, nullable=False)
@@ -5,6 +5,7 @@ from datetime import datetime
 
 from sqlalchemy import select
 
+from server.core.security import hash_api_key
 from server.db.database import AsyncSessionLocal, engine
 from server.db.models import Agent, Base
 
@@ -30,14 +31,14 @@ async def seed_database():
         if existing_admin:
             print("⚠️  Admin token already exists!")
             print(f"   Agent ID: {existing_admin.id}")
-            print(f"   API Key: {existing_admin.api_key}")
+            print("   API Key: see .admin_token.txt (only its hash is stored)")
             print("\n   To regenerate, delete the database and run seed again.")
             return
         
         # Create admin agent
         admin_agent = Agent(
             id="admin_lovable_ui",
-            api_key=admin_token,
+            api_key_hash=hash_api_key(admin_token),
             os_name="Web",
             os_version="N/A",
             os_build="N/A",
@@ -13,10 +13,11 @@ Recommended/Optional extensions:
 - addresses, contracts, marketplaces, llm_models (future extensions)
 """
 
-import json
+import functools
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pytest
 
 
@@ -25,10 +26,14 @@ AGENTS_DIR = Path(__file__).parent.parent.parent / "platform" / "agentify" / "ag
 AGENT_MANIFESTS = list(AGENTS_DIR.glob("*/manifest.json"))
 
 
+@functools.cache
 def load_manifest(manifest_path: Path) -> dict[str, Any]:
-    """Load and parse a manifest JSON file."""
-    with open(manifest_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load and parse a manifest JSON file.
+
+    Cached, so each manifest is parsed once per session; every test gets the
+    same dict and must not modify it.
+    """
+    return orjson.loads(manifest_path.read_bytes())
 
 
 class TestAgentStandardV1Core:
@@ -163,9 +163,9 @@ def test_create_job_missing_intent(client: TestClient) -> None:
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
-def test_list_jobs_empty(client: TestClient, mock_redis: MagicMock) -> None:
+def test_list_jobs_empty(client: TestClient, mock_job_queue: MagicMock) -> None:
     """Test listing jobs when queue is empty."""
-    mock_redis.keys.return_value = []
+    mock_job_queue.list_jobs.return_value = []
 
     response = client.get("/jobs")
 
@@ -176,30 +176,12 @@ def test_list_jobs_empty(client: TestClient, mock_redis: MagicMock) -> None:
 
 
 def test_list_jobs_with_results(
-    client: TestClient, mock_redis: MagicMock, sample_job: Job
+    client: TestClient, mock_job_queue: MagicMock, sample_job: Job
 ) -> None:
     """Test listing jobs with results."""
-    # Mock Redis to return job data
-    # Create a JSON representation manually (without TaskGraph)
-    import json
-
-    job_json = json.dumps(
-        {
-            "id": "test-job-123",
-            "intent": "test_intent",
-            "task_graph": {"tasks": {}},
-            "status": "pending",
-            "created_at": sample_job.created_at.isoformat(),
-            "started_at": None,
-            "completed_at": None,
-            "error": None,
-            "retry_count": 0,
-            "max_retries": 3,
-        }
-    )
-
-    mock_redis.keys.return_value = [b"job:test-job-123"]
-    mock_redis.get.return_value = job_json
+    mock_job_queue.list_jobs.return_value = [
+        Job(id="test-job-123", intent="test_intent", task_graph=TaskGraph()),
+    ]
 
     response = client.get("/jobs")
 
@@ -212,44 +194,20 @@ def test_list_jobs_with_results(
 
 
 def test_list_jobs_with_status_filter(
-    client: TestClient, mock_redis: MagicMock, sample_job: Job
+    client: TestClient, mock_job_queue: MagicMock, sample_job: Job
 ) -> None:
     """Test listing jobs with status filter."""
     # Create jobs with different statuses
-    import json
-
-    job1_json = json.dumps(
-        {
-            "id": "job1",
-            "intent": "test_intent",
-            "task_graph": {"tasks": {}},
-            "status": "pending",
-            "created_at": sample_job.created_at.isoformat(),
-            "started_at": None,
-            "completed_at": None,
-            "error": None,
-            "retry_count": 0,
-            "max_retries": 3,
-        }
-    )
-
-    job2_json = json.dumps(
-        {
-            "id": "job2",
-            "intent": "test_intent",
-            "task_graph": {"tasks": {}},
-            "status": "running",
-            "created_at": sample_job.created_at.isoformat(),
-            "started_at": sample_job.created_at.isoformat(),
-            "completed_at": None,
-            "error": None,
-            "retry_count": 0,
-            "max_retries": 3,
-        }
-    )
-
-    mock_redis.keys.return_value = [b"job:job1", b"job:job2"]
-    mock_redis.get.side_effect = [job1_json, job2_json]
+    mock_job_queue.list_jobs.return_value = [
+        Job(id="job1", intent="test_intent", task_graph=TaskGraph(), status=JobStatus.PENDING),
+        Job(
+            id="job2",
+            intent="test_intent",
+            task_graph=TaskGraph(),
+            status=JobStatus.RUNNING,
+            started_at=sample_job.created_at,
+        ),
+    ]
 
     response = client.get("/jobs?status_filter=pending")
 
@@ -260,32 +218,13 @@ def test_list_jobs_with_status_filter(
 
 
 def test_list_jobs_with_pagination(
-    client: TestClient, mock_redis: MagicMock, sample_job: Job
+    client: TestClient, mock_job_queue: MagicMock, sample_job: Job
 ) -> None:
     """Test listing jobs with pagination."""
     # Create 5 jobs
-    import json
-
-    jobs_json = []
-    for i in range(5):
-        job_json = json.dumps(
-            {
-                "id": f"job{i}",
-                "intent": "test_intent",
-                "task_graph": {"tasks": {}},
-                "status": "pending",
-                "created_at": sample_job.created_at.isoformat(),
-                "started_at": None,
-                "completed_at": None,
-                "error": None,
-                "retry_count": 0,
-                "max_retries": 3,
-            }
-        )
-        jobs_json.append(job_json)
-
-    mock_redis.keys.return_value = [f"job:job{i}".encode() for i in range(5)]
-    mock_redis.get.side_effect = jobs_json
+    mock_job_queue.list_jobs.return_value = [
+        Job(id=f"job{i}", intent="test_intent", task_graph=TaskGraph()) for i in range(5)
+    ]
 
     response = client.get("/jobs?limit=2&offset=1")
 
@@ -320,7 +259,7 @@ def test_get_job_not_found(client: TestClient, mock_job_queue: MagicMock) -> Non
 
 def test_cancel_job_success(client: TestClient, mock_job_queue: MagicMock, sample_job: Job) -> None:
     """Test cancelling a job."""
-    mock_job_queue.get_job.return_value = sample_job
+    mock_job_queue.cancel.return_value = JobStatus.PENDING
 
     response = client.delete(f"/jobs/{sample_job.id}")
 
@@ -330,7 +269,7 @@ def test_cancel_job_success(client: TestClient, mock_job_queue: MagicMock, sampl
 
 def test_cancel_job_not_found(client: TestClient, mock_job_queue: MagicMock) -> None:
     """Test cancelling non-existent job."""
-    mock_job_queue.get_job.return_value = None
+    mock_job_queue.cancel.return_value = None
 
     response = client.delete("/jobs/nonexistent")
 
@@ -341,8 +280,7 @@ def test_cancel_job_already_done(
     client: TestClient, mock_job_queue: MagicMock, sample_job: Job
 ) -> None:
     """Test cancelling already completed job."""
-    sample_job.status = JobStatus.DONE
-    mock_job_queue.get_job.return_value = sample_job
+    mock_job_queue.cancel.return_value = JobStatus.DONE
 
     response = client.delete(f"/jobs/{sample_job.id}")
 
@@ -354,7 +292,7 @@ def test_retry_job_success(client: TestClient, mock_job_queue: MagicMock, sample
     """Test retrying a failed job."""
     sample_job.status = JobStatus.FAILED
     sample_job.error = "Test error"
-    mock_job_queue.get_job.side_effect = [sample_job, sample_job]  # Called twice
+    mock_job_queue.get_job.return_value = sample_job
     mock_job_queue.retry.return_value = True
 
     response = client.post(f"/jobs/{sample_job.id}/retry")
@@ -362,7 +300,11 @@ def test_retry_job_success(client: TestClient, mock_job_queue: MagicMock, sample
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["id"] == sample_job.id
+    assert data["status"] == JobStatus.PENDING.value
+    assert data["retry_count"] == 1
+    assert data["error"] is None
     mock_job_queue.retry.assert_called_once_with(sample_job.id)
+    mock_job_queue.get_job.assert_called_once_with(sample_job.id)
 
 
 def test_retry_job_not_failed(
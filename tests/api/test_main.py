@@ -89,13 +89,14 @@ def test_health_check_redis_unhealthy(client: TestClient, mock_redis: MagicMock)
 
 def test_health_check_redis_not_connected(client: TestClient) -> None:
     """Test health check endpoint when Redis is not connected."""
-    with patch("scheduler.main.job_queue", None):
-        response = client.get("/health")
+    app.state.job_queue = None
 
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert data["components"]["redis"]["status"] == "not_connected"
+    response = client.get("/health")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["components"]["redis"]["status"] == "not_connected"
 
 
 def test_cors_headers(client: TestClient) -> None:
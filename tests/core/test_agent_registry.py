@@ -0,0 +1,61 @@
+"""Tests for Agent Registry."""
+
+from pathlib import Path
+
+from scheduler.core.agent_registry import Agent, AgentRegistry
+
+
+class TestAgentRegistry:
+    """Tests for AgentRegistry class."""
+
+    def test_get_agent_by_capability(self) -> None:
+        """Test capability lookup returns the first matching agent."""
+        registry = AgentRegistry()
+        registry.register_agent(
+            Agent(name="calc", endpoint="http://calc:8000", capabilities=["calculate", "math"])
+        )
+        registry.register_agent(
+            Agent(name="calc2", endpoint="http://calc2:8000", capabilities=["calculate"])
+        )
+
+        agent = registry.get_agent_by_capability("calculate")
+        assert agent is not None
+        assert agent.name == "calc"
+        assert [a.name for a in registry.get_agents_by_capability("calculate")] == [
+            "calc",
+            "calc2",
+        ]
+        assert registry.get_agent_by_capability("format") is None
+
+    def test_capability_index_follows_register_and_unregister(self) -> None:
+        """Test re-registering and unregistering agents updates capability lookups."""
+        registry = AgentRegistry()
+        registry.register_agent(
+            Agent(name="fmt", endpoint="http://fmt:8000", capabilities=["format"])
+        )
+        registry.register_agent(
+            Agent(name="fmt", endpoint="http://fmt-v2:8000", capabilities=["format"])
+        )
+
+        agent = registry.get_agent_by_capability("format")
+        assert agent is not None
+        assert agent.endpoint == "http://fmt-v2:8000"
+
+        assert registry.unregister_agent("fmt") is True
+        assert registry.get_agent_by_capability("format") is None
+
+    def test_load_agents_from_config(self, tmp_path: Path) -> None:
+        """Test agents loaded from YAML are indexed by capability."""
+        config = tmp_path / "agents.yaml"
+        config.write_text(
+            "agents:\n"
+            "  - name: calculation-agent\n"
+            "    endpoint: http://calculation-agent:8000\n"
+            "    capabilities: [calculate]\n"
+        )
+
+        registry = AgentRegistry(config)
+
+        agent = registry.get_agent_by_capability("calculate")
+        assert agent is not None
+        assert agent.name == "calculation-agent"
@@ -0,0 +1,173 @@
+"""Tests for Calculator Orchestrator."""
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from scheduler.core.agent_registry import Agent, AgentRegistry
+from scheduler.core.lam_protocol import MessageType, RequestMessage
+from scheduler.core.task_graph import TaskGraph
+from scheduler.job_queue.job_queue import Job, JobStatus
+from scheduler.orchestrator.calculator_orchestrator import CalculatorOrchestrator
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Answer LAM requests the way the calculation and formatting agents do."""
+    message = json.loads(request.content)
+    payload = message["payload"]
+    if request.url.host == "calc":
+        if payload["operator"] == "divide" and payload["num2"] == 0:
+            return httpx.Response(
+                200, json={"type": "failure", "payload": {"error": "Division by zero"}}
+            )
+        return httpx.Response(
+            200, json={"type": "inform", "payload": {"result": payload["num1"] + payload["num2"]}}
+        )
+    return httpx.Response(
+        200, json={"type": "inform", "payload": {"formatted": f"{payload['value']:.2f}"}}
+    )
+
+
+@pytest.fixture
+def registry() -> AgentRegistry:
+    """Create registry with calculation and formatting agents."""
+    registry = AgentRegistry()
+    registry.register_agent(
+        Agent(name="calc", endpoint="http://calc:8000", capabilities=["calculate"])
+    )
+    registry.register_agent(
+        Agent(name="fmt", endpoint="http://fmt:8000", capabilities=["format"])
+    )
+    return registry
+
+
+@pytest.fixture
+def job_queue() -> AsyncMock:
+    """Create mock job queue."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def orchestrator(registry: AgentRegistry, job_queue: AsyncMock) -> CalculatorOrchestrator:
+    """Create orchestrator talking to the mock agents."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    return CalculatorOrchestrator(registry, job_queue, http_client=client)
+
+
+class TestCalculatorOrchestrator:
+    """Tests for CalculatorOrchestrator class."""
+
+    async def test_process_calculation_job(
+        self, orchestrator: CalculatorOrchestrator, job_queue: AsyncMock
+    ) -> None:
+        """Test a job runs through both agents and stores the formatted result."""
+        job = Job(
+            intent="calculate",
+            task_graph=TaskGraph(),
+            result={"num1": 10, "num2": 5, "operator": "add"},
+        )
+
+        await orchestrator.process_calculation_job(job)
+
+        job_queue.update_status.assert_awaited_once_with(job.id, JobStatus.RUNNING)
+        job_queue.set_result.assert_awaited_once()
+        job_id, result = job_queue.set_result.await_args.args
+        assert job_id == job.id
+        assert result["raw_result"] == 15.0
+        assert result["formatted_result"] == "15.00"
+
+    async def test_agent_failure_marks_job_failed(
+        self, orchestrator: CalculatorOrchestrator, job_queue: AsyncMock
+    ) -> None:
+        """Test a failure message from an agent fails the job."""
+        job = Job(
+            intent="calculate",
+            task_graph=TaskGraph(),
+            result={"num1": 10, "num2": 0, "operator": "divide"},
+        )
+
+        await orchestrator.process_calculation_job(job)
+
+        job_queue.set_result.assert_not_awaited()
+        job_queue.update_status.assert_awaited_with(
+            job.id, JobStatus.FAILED, error="Calculation agent error: Division by zero"
+        )
+
+    async def test_inform_without_result(
+        self, registry: AgentRegistry, job_queue: AsyncMock
+    ) -> None:
+        """Test an inform message missing the result key raises."""
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"type": "inform", "payload": {}})
+            )
+        )
+        orchestrator = CalculatorOrchestrator(registry, job_queue, http_client=client)
+
+        with pytest.raises(ValueError, match="Missing 'formatted' in formatting agent response"):
+            await orchestrator._call_formatting_agent(1.0, "en-US", 2, "conv-1")
+
+    async def test_agent_url_refreshed_after_http_error(
+        self, registry: AgentRegistry, job_queue: AsyncMock
+    ) -> None:
+        """Test the cached agent URL is dropped when a call fails."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "fmt":
+                return httpx.Response(503)
+            return _handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        orchestrator = CalculatorOrchestrator(registry, job_queue, http_client=client)
+
+        with pytest.raises(ValueError, match="Failed to call formatting agent"):
+            await orchestrator._call_formatting_agent(1.0, "en-US", 2, "conv-1")
+
+        registry.register_agent(
+            Agent(name="fmt", endpoint="http://fmt2:8000", capabilities=["format"])
+        )
+
+        assert await orchestrator._call_formatting_agent(1.0, "en-US", 2, "conv-1") == "1.00"
+
+    async def test_redirect_is_treated_as_failure(
+        self, registry: AgentRegistry, job_queue: AsyncMock
+    ) -> None:
+        """Test a 3xx reply fails the call instead of being parsed as a LAM message."""
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(302, headers={"Location": "http://elsewhere/"})
+            )
+        )
+        orchestrator = CalculatorOrchestrator(registry, job_queue, http_client=client)
+
+        with pytest.raises(ValueError, match="Failed to call formatting agent"):
+            await orchestrator._call_formatting_agent(1.0, "en-US", 2, "conv-1")
+
+        assert "format" not in orchestrator._agent_urls
+
+    def test_build_request_is_valid_lam_request(
+        self, orchestrator: CalculatorOrchestrator
+    ) -> None:
+        """Test requests built from the template parse as RequestMessage."""
+        first = orchestrator._build_request("calculate", {"num1": 1}, "conv-1")
+        second = orchestrator._build_request("format", {"value": 1.0}, "conv-1")
+
+        message = RequestMessage(**first)
+        assert message.type == MessageType.REQUEST
+        assert message.sender == CalculatorOrchestrator.SENDER
+        assert message.intent == "calculate"
+        assert message.payload == {"num1": 1}
+        assert message.correlation == {"conversation_id": "conv-1"}
+        assert first["id"] != second["id"]
+        assert set(first) == set(RequestMessage(sender="s", intent="i").to_dict())
+
+    async def test_missing_agent(self, job_queue: AsyncMock) -> None:
+        """Test calling a capability with no registered agent raises."""
+        orchestrator = CalculatorOrchestrator(AgentRegistry(), job_queue)
+
+        with pytest.raises(ValueError, match="Formatting agent not found in registry"):
+            await orchestrator._call_formatting_agent(1.0, "en-US", 2, "conv-1")
+
+        await orchestrator.close()
@@ -5,10 +5,22 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis.asyncio import BlockingConnectionPool
 from scheduler.core.task_graph import ActionType, TaskGraph, ToDo
 from scheduler.job_queue.job_queue import Job, JobQueue, JobStatus
 
 
+def _as_hash(job: Job) -> dict[bytes, bytes]:
+    """Encode a job the way it is stored in its Redis hash."""
+    return {key.encode(): json.dumps(value).encode() for key, value in job.model_dump().items()}
+
+
+def _script_fields(args: list) -> tuple[int, dict]:
+    """Split _update_job script args into the always-written count and field map."""
+    count, *pairs = args
+    return count, dict(zip(pairs[::2], pairs[1::2], strict=True))
+
+
 class TestJob:
     """Tests for Job model."""
 
@@ -76,21 +88,40 @@ class TestJobQueue:
         redis_mock.ping = AsyncMock(return_value=True)
         redis_mock.rpush = AsyncMock(return_value=1)
         redis_mock.lpop = AsyncMock(return_value=None)
-        redis_mock.get = AsyncMock(return_value=None)
-        redis_mock.set = AsyncMock(return_value=True)
+        redis_mock.hgetall = AsyncMock(return_value={})
+        redis_mock.hset = AsyncMock(return_value=1)
         redis_mock.delete = AsyncMock(return_value=1)
         redis_mock.close = AsyncMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        redis_mock.pipeline.return_value.__aenter__.return_value = pipe
+        redis_mock.register_script.side_effect = lambda script: AsyncMock(return_value=1)
         return redis_mock
 
     @pytest.mark.asyncio
     async def test_create_job_queue(self, mock_redis: MagicMock) -> None:
         """Test creating a job queue."""
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
-            queue = JobQueue(redis_url="redis://localhost:6379")
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379", max_connections=5)
             await queue.connect()
             assert queue is not None
             await queue.close()
 
+    @pytest.mark.asyncio
+    async def test_connect_uses_blocking_pool(self, mock_redis: MagicMock) -> None:
+        """Test the client is built on a bounded blocking connection pool."""
+        with patch(
+            "scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis
+        ) as from_pool:
+            queue = JobQueue(redis_url="redis://localhost:6379", max_connections=5)
+            await queue.connect()
+
+            pool = from_pool.call_args.args[0]
+            assert isinstance(pool, BlockingConnectionPool)
+            assert pool.max_connections == 5
+
+            await queue.close()
+
     @pytest.mark.asyncio
     async def test_enqueue_job(self, mock_redis: MagicMock) -> None:
         """Test enqueueing a job."""
@@ -98,7 +129,7 @@ class TestJobQueue:
         task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
         job = Job(intent="send_mail", task_graph=graph)
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
@@ -106,6 +137,31 @@ class TestJobQueue:
             assert job_id is not None
             assert isinstance(job_id, str)
 
+            # Job data and queue entry go out in one pipeline
+            pipe = mock_redis.pipeline.return_value.__aenter__.return_value
+            pipe.hset.assert_called_once()
+            pipe.rpush.assert_called_once_with(queue.queue_key, job_id)
+            pipe.execute.assert_awaited_once()
+
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many(self, mock_redis: MagicMock) -> None:
+        """Test enqueueing several jobs in one pipeline."""
+        jobs = [Job(intent="send_mail", task_graph=TaskGraph()) for _ in range(3)]
+
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            job_ids = await queue.enqueue_many(jobs)
+            assert job_ids == [job.id for job in jobs]
+
+            pipe = mock_redis.pipeline.return_value.__aenter__.return_value
+            assert pipe.hset.call_count == 3
+            pipe.rpush.assert_called_once_with(queue.queue_key, *job_ids)
+            pipe.execute.assert_awaited_once()
+
             await queue.close()
 
     @pytest.mark.asyncio
@@ -118,11 +174,10 @@ class TestJobQueue:
         # Mock lpop to return job ID
         mock_redis.lpop = AsyncMock(return_value=job.id.encode())
 
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
+        # Mock hgetall to return serialized job
+        mock_redis.hgetall = AsyncMock(return_value=_as_hash(job))
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
@@ -132,12 +187,44 @@ class TestJobQueue:
 
             await queue.close()
 
+    @pytest.mark.asyncio
+    async def test_dequeue_blocking(self, mock_redis: MagicMock) -> None:
+        """Test blocking dequeue pops with BLPOP and loads the job."""
+        job = Job(intent="send_mail", task_graph=TaskGraph())
+        mock_redis.blpop = AsyncMock(return_value=(b"cpa:jobs:queue", job.id.encode()))
+        mock_redis.hgetall = AsyncMock(return_value=_as_hash(job))
+
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            dequeued_job = await queue.dequeue_blocking(timeout=2)
+            assert dequeued_job is not None
+            assert dequeued_job.id == job.id
+            mock_redis.blpop.assert_awaited_once_with([queue.queue_key], timeout=2)
+
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_dequeue_blocking_timeout(self, mock_redis: MagicMock) -> None:
+        """Test blocking dequeue returns None when BLPOP times out."""
+        mock_redis.blpop = AsyncMock(return_value=None)
+
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            assert await queue.dequeue_blocking() is None
+            mock_redis.hgetall.assert_not_called()
+
+            await queue.close()
+
     @pytest.mark.asyncio
     async def test_dequeue_empty_queue(self, mock_redis: MagicMock) -> None:
         """Test dequeueing from empty queue."""
         mock_redis.lpop = AsyncMock(return_value=None)
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
@@ -146,32 +233,90 @@ class TestJobQueue:
 
             await queue.close()
 
+    def test_large_task_graph_round_trip(self) -> None:
+        """Test large task graphs are stored compressed and load back unchanged."""
+        graph = TaskGraph()
+        for i in range(100):
+            graph.add_task(ToDo(action=ActionType.TYPE, selector=f"#field-{i}", text="x" * 50))
+        job = Job(intent="send_mail", task_graph=graph)
+        queue = JobQueue()
+
+        fields = queue._serialize_job(job)
+        assert not fields["task_graph"].startswith(b"{")
+
+        restored = queue._deserialize_job({k.encode(): v for k, v in fields.items()})
+        assert restored.task_graph.tasks == job.task_graph.tasks
+
+    def test_small_task_graph_stored_as_json(self) -> None:
+        """Test small task graphs are stored as plain JSON."""
+        graph = TaskGraph()
+        graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
+        job = Job(intent="send_mail", task_graph=graph)
+
+        fields = JobQueue()._serialize_job(job)
+
+        assert json.loads(fields["task_graph"]) == job.model_dump()["task_graph"]
+
+    def test_job_key_is_bytes(self) -> None:
+        """Test job keys are built as bytes from str or bytes IDs."""
+        queue = JobQueue()
+
+        assert queue._get_job_key("abc") == b"cpa:jobs:data:abc"
+        assert queue._get_job_key(b"abc") == b"cpa:jobs:data:abc"
+
+    @pytest.mark.asyncio
+    async def test_dequeue_batch(self, mock_redis: MagicMock) -> None:
+        """Test dequeueing several jobs at once skips missing job data."""
+        jobs = [Job(intent="send_mail", task_graph=TaskGraph()) for _ in range(2)]
+        mock_redis.lpop = AsyncMock(return_value=[jobs[0].id.encode(), b"gone", jobs[1].id.encode()])
+        pipe = mock_redis.pipeline.return_value.__aenter__.return_value
+        pipe.execute = AsyncMock(return_value=[_as_hash(jobs[0]), {}, _as_hash(jobs[1])])
+
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            dequeued = await queue.dequeue_batch(10)
+            assert [job.id for job in dequeued] == [job.id for job in jobs]
+            mock_redis.lpop.assert_awaited_once_with(queue.queue_key, 10)
+            assert pipe.hgetall.call_count == 3
+
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_dequeue_batch_empty_queue(self, mock_redis: MagicMock) -> None:
+        """Test dequeueing a batch from an empty queue."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            assert await queue.dequeue_batch() == []
+
+            await queue.close()
+
     @pytest.mark.asyncio
     async def test_get_job_status(self, mock_redis: MagicMock) -> None:
         """Test getting job status."""
-        graph = TaskGraph()
-        task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
-        job = Job(id="test-123", intent="send_mail", task_graph=graph, status=JobStatus.RUNNING)
-
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
+        # Mock hget to return the stored status field
+        mock_redis.hget = AsyncMock(return_value=b'"running"')
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
             status = await queue.get_status("test-123")
             assert status == JobStatus.RUNNING
+            mock_redis.hget.assert_awaited_once_with(queue._get_job_key("test-123"), "status")
+            mock_redis.hgetall.assert_not_awaited()
 
             await queue.close()
 
     @pytest.mark.asyncio
     async def test_get_job_status_not_found(self, mock_redis: MagicMock) -> None:
         """Test getting status of non-existent job."""
-        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.hget = AsyncMock(return_value=None)
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
@@ -182,76 +327,132 @@ class TestJobQueue:
 
     @pytest.mark.asyncio
     async def test_update_job_status(self, mock_redis: MagicMock) -> None:
-        """Test updating job status."""
-        graph = TaskGraph()
-        task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
-        job = Job(id="test-123", intent="send_mail", task_graph=graph)
+        """Test updating job status writes only the changed fields."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
 
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
+            await queue.update_status("test-123", JobStatus.DONE, error="late")
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+            # No read-modify-write: one script call, no HGETALL
+            mock_redis.hgetall.assert_not_awaited()
+            queue._update_job.assert_awaited_once()
+            kwargs = queue._update_job.await_args.kwargs
+            assert kwargs["keys"] == [queue._get_job_key("test-123")]
+            count, fields = _script_fields(kwargs["args"])
+            assert count == 3
+            assert json.loads(fields["status"]) == "done"
+            assert json.loads(fields["error"]) == "late"
+            assert "completed_at" in fields
+
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_update_job_status_running_sets_started_at_if_unset(
+        self, mock_redis: MagicMock
+    ) -> None:
+        """Test RUNNING passes started_at as a write-if-null field."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
-            await queue.update_status("test-123", JobStatus.DONE)
+            await queue.update_status("test-123", JobStatus.RUNNING)
 
-            # Verify set was called
-            mock_redis.set.assert_called_once()
+            count, *pairs = queue._update_job.await_args.kwargs["args"]
+            assert count == 1
+            assert pairs[2] == "started_at"
 
             await queue.close()
 
     @pytest.mark.asyncio
-    async def test_retry_job(self, mock_redis: MagicMock) -> None:
-        """Test retrying a job."""
-        graph = TaskGraph()
-        task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
-        job = Job(
-            id="test-123",
-            intent="send_mail",
-            task_graph=graph,
-            status=JobStatus.FAILED,
-            retry_count=1,
-        )
+    async def test_mark_failed(self, mock_redis: MagicMock) -> None:
+        """Test failing a held job updates it and writes it in one script call."""
+        job = Job(id="test-123", intent="unknown", task_graph=TaskGraph())
+
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            await queue.mark_failed(job, "Unknown intent: unknown")
+
+            assert job.status == JobStatus.FAILED
+            assert job.error == "Unknown intent: unknown"
+            assert job.completed_at is not None
+            mock_redis.hgetall.assert_not_awaited()
+            mock_redis.hset.assert_not_called()
+            queue._update_job.assert_awaited_once()
+            kwargs = queue._update_job.await_args.kwargs
+            assert kwargs["keys"] == [queue._get_job_key("test-123")]
+            count, fields = _script_fields(kwargs["args"])
+            assert count == 3
+            assert json.loads(fields["status"]) == "failed"
+            assert json.loads(fields["error"]) == "Unknown intent: unknown"
+
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_set_result_writes_fields_only(self, mock_redis: MagicMock) -> None:
+        """Test set_result updates result and status without touching the task graph."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+
+            await queue.set_result("test-123", {"formatted_result": "15.00"})
+
+            mock_redis.hgetall.assert_not_called()
+            mock_redis.hset.assert_not_called()
+            kwargs = queue._update_job.await_args.kwargs
+            assert kwargs["keys"] == [queue._get_job_key("test-123")]
+            count, fields = _script_fields(kwargs["args"])
+            assert count == 3
+            assert set(fields) == {"status", "result", "completed_at"}
+            assert json.loads(fields["status"]) == "done"
+            assert json.loads(fields["result"]) == {"formatted_result": "15.00"}
+
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_set_result_missing_job(self, mock_redis: MagicMock) -> None:
+        """Test set_result on a deleted job writes nothing outside the guarded script."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+            queue._update_job.return_value = 0
+
+            await queue.set_result("nonexistent", {"formatted_result": "15.00"})
 
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
+            # The script checks EXISTS before writing, so no partial hash is created
+            queue._update_job.assert_awaited_once()
+            mock_redis.hset.assert_not_called()
+            mock_redis.pipeline.assert_not_called()
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_retry_job(self, mock_redis: MagicMock) -> None:
+        """Test retrying a job."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
             success = await queue.retry("test-123")
             assert success is True
 
-            # Verify rpush was called (job re-enqueued)
-            assert mock_redis.rpush.call_count >= 1
+            # Limit check, reset and re-enqueue happen in one script call
+            mock_redis.hgetall.assert_not_awaited()
+            kwargs = queue._retry_job.await_args.kwargs
+            assert kwargs["keys"] == [queue._get_job_key("test-123"), queue.queue_key]
+            assert kwargs["args"][1] == "test-123"
 
             await queue.close()
 
     @pytest.mark.asyncio
     async def test_retry_job_max_retries_exceeded(self, mock_redis: MagicMock) -> None:
         """Test retrying a job that exceeded max retries."""
-        graph = TaskGraph()
-        task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
-        job = Job(
-            id="test-123",
-            intent="send_mail",
-            task_graph=graph,
-            status=JobStatus.FAILED,
-            retry_count=3,
-            max_retries=3,
-        )
-
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
-
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
+            queue._retry_job.return_value = 0
 
             success = await queue.retry("test-123")
             assert success is False
@@ -260,23 +461,32 @@ class TestJobQueue:
 
     @pytest.mark.asyncio
     async def test_cancel_job(self, mock_redis: MagicMock) -> None:
-        """Test canceling a job."""
-        graph = TaskGraph()
-        task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
-        job = Job(id="test-123", intent="send_mail", task_graph=graph)
+        """Test canceling a job checks and updates status in one script call."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+            queue._cancel_job.return_value = b'"running"'
+
+            previous = await queue.cancel("test-123")
 
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
+            assert previous == JobStatus.RUNNING
+            mock_redis.hgetall.assert_not_awaited()
+            kwargs = queue._cancel_job.await_args.kwargs
+            assert kwargs["keys"] == [queue._get_job_key("test-123")]
+            assert json.loads(kwargs["args"][0]) == "cancelled"
+            assert {json.loads(arg) for arg in kwargs["args"][2:]} == {"done", "cancelled"}
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+            await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_job_not_found(self, mock_redis: MagicMock) -> None:
+        """Test canceling a missing job returns None."""
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
+            queue._cancel_job.return_value = None
 
-            await queue.cancel("test-123")
-
-            # Verify set was called to update status
-            mock_redis.set.assert_called_once()
+            assert await queue.cancel("nonexistent") is None
 
             await queue.close()
 
@@ -287,11 +497,10 @@ class TestJobQueue:
         task_id = graph.add_task(ToDo(action=ActionType.CLICK, selector="button"))
         job = Job(id="test-123", intent="send_mail", task_graph=graph)
 
-        # Mock get to return serialized job
-        job_data = json.dumps(job.model_dump())
-        mock_redis.get = AsyncMock(return_value=job_data.encode())
+        # Mock hgetall to return serialized job
+        mock_redis.hgetall = AsyncMock(return_value=_as_hash(job))
 
-        with patch("scheduler.queue.job_queue.Redis.from_url", return_value=mock_redis):
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
             queue = JobQueue(redis_url="redis://localhost:6379")
             await queue.connect()
 
@@ -302,3 +511,29 @@ class TestJobQueue:
 
             await queue.close()
 
+
+    @pytest.mark.asyncio
+    async def test_list_jobs(self, mock_redis: MagicMock) -> None:
+        """Test listing jobs scans job keys and skips jobs deleted during the scan."""
+        job = Job(id="test-123", intent="send_mail", task_graph=TaskGraph())
+
+        with patch("scheduler.job_queue.job_queue.Redis.from_pool", return_value=mock_redis):
+            queue = JobQueue(redis_url="redis://localhost:6379")
+            await queue.connect()
+            job_keys = [queue._get_job_key("test-123"), queue._get_job_key("deleted")]
+
+            async def scan_iter(match: str):
+                for key in job_keys:
+                    yield key
+
+            mock_redis.scan_iter = MagicMock(side_effect=scan_iter)
+            pipe = mock_redis.pipeline.return_value.__aenter__.return_value
+            pipe.execute.return_value = [_as_hash(job), {}]
+
+            jobs = await queue.list_jobs()
+
+            mock_redis.scan_iter.assert_called_once_with(match="cpa:jobs:data:*")
+            assert [call.args[0] for call in pipe.hgetall.call_args_list] == job_keys
+            assert [listed.id for listed in jobs] == ["test-123"]
+
+            await queue.close()